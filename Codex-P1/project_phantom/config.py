@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import cached_property
 
 
 @dataclass
@@ -12,7 +13,7 @@ class SignalWeights:
     oi_divergence: float = 0.30
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ThresholdConfig:
     score_threshold: float = 0.70
     component_threshold: float = 0.50
@@ -46,7 +47,7 @@ class AdaptiveGateConfig:
     min_samples: int = 40
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BackoffConfig:
     min_seconds: float = 2.0
     max_seconds: float = 60.0
@@ -62,8 +63,24 @@ class ExchangeEndpoints:
     okx_rest: str = "https://www.okx.com"
     whale_alert_rest: str = "https://api.whale-alert.io/v1"
 
+    @cached_property
+    def binance_ping_url(self) -> str:
+        return f"{self.binance_rest.rstrip('/')}/fapi/v1/ping"
 
-@dataclass
+    @cached_property
+    def bybit_time_url(self) -> str:
+        return f"{self.bybit_rest.rstrip('/')}/v5/market/time"
+
+    @cached_property
+    def okx_time_url(self) -> str:
+        return f"{self.okx_rest.rstrip('/')}/api/v5/public/time"
+
+    @cached_property
+    def whale_alert_status_url(self) -> str:
+        return f"{self.whale_alert_rest.rstrip('/')}/status"
+
+
+@dataclass(frozen=True, slots=True)
 class Layer0Config:
     symbol: str = "BTCUSDT"
     cadence_seconds: float = 15.0
@@ -118,7 +135,7 @@ class Layer1ThresholdConfig:
     min_component_hits: int = 3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WhaleAlertConfig:
     enabled: bool = False
     api_key: str | None = None
@@ -126,7 +143,7 @@ class WhaleAlertConfig:
     min_transfer_usd: float = 1_000_000.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Layer1Config:
     symbol: str = "BTCUSDT"
     cadence_seconds: float = 1.0
@@ -222,7 +239,18 @@ class TelegramConfig:
     chat_id: str | None = field(default_factory=lambda: os.getenv("TG_CHAT_ID"))
     health_enabled: bool = True
     health_poll_interval_seconds: float = 2.0
+    health_long_poll_timeout_seconds: int = 30
+    health_offset_path: str | None = field(
+        default_factory=lambda: os.getenv("TG_OFFSET_PATH", "~/.cache/phantom/telegram_update_offset")
+    )
     health_cooldown_seconds: float = 20.0
+    health_cache_ttl_seconds: float = 10.0
+    # When set, /health commands arrive via webhook at {url}/telegram/{secret} instead of polling.
+    health_webhook_url: str | None = field(default_factory=lambda: os.getenv("TG_WEBHOOK_URL"))
+    health_webhook_secret: str | None = field(default_factory=lambda: os.getenv("TG_WEBHOOK_SECRET"))
+    # Loopback by default; a reverse proxy (or TG_WEBHOOK_HOST) decides what is exposed publicly.
+    health_webhook_host: str = field(default_factory=lambda: os.getenv("TG_WEBHOOK_HOST", "127.0.0.1"))
+    health_webhook_port: int = field(default_factory=lambda: int(os.getenv("TG_WEBHOOK_PORT", "8443")))
 
 
 @dataclass
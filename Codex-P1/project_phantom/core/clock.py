@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import time
+
+
+def now_ms() -> int:
+    # Wall clock on purpose: these timestamps are compared against exchange event times.
+    return time.time_ns() // 1_000_000
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+
+_POOL_BYTES = 4096
+
+_pool = b""
+_pos = 0
+
+
+def new_event_id() -> str:
+    """
+    Return a random (version 4) UUID string, drawing entropy from a pooled urandom read.
+    """
+    global _pool, _pos
+    if _pos + 16 > len(_pool):
+        _pool = os.urandom(_POOL_BYTES)
+        _pos = 0
+    raw = bytearray(_pool[_pos : _pos + 16])
+    _pos += 16
+    raw[6] = (raw[6] & 0x0F) | 0x40
+    raw[8] = (raw[8] & 0x3F) | 0x80
+    digest = raw.hex()
+    return f"{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:]}"
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+try:
+    from orjson import loads as json_loads
+except ModuleNotFoundError:
+    from json import loads as json_loads
+
+__all__ = ["json_loads"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+from array import array
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RingQueue(Generic[T]):
+    """
+    Bounded single-consumer queue over a preallocated ring, API-compatible with the asyncio.Queue subset the layers use.
+    """
+
+    __slots__ = ("maxsize", "_ring", "_head", "_size", "_not_empty", "_not_full", "_depths", "_depth_slot")
+
+    def __init__(self, maxsize: int, *, depths: array[int] | None = None, depth_slot: int = 0) -> None:
+        if maxsize <= 0:
+            raise ValueError("RingQueue requires a positive maxsize")
+        self.maxsize = maxsize
+        self._ring: list[T | None] = [None] * maxsize
+        self._head = 0
+        self._size = 0
+        # Waiters park on events that only flip on empty<->non-empty / full<->non-full transitions.
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        # Optional shared running total, so aggregate depth across many queues is a single read.
+        self._depths = depths
+        self._depth_slot = depth_slot
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def full(self) -> bool:
+        return self._size >= self.maxsize
+
+    def put_nowait(self, item: T) -> None:
+        if self._size >= self.maxsize:
+            raise asyncio.QueueFull
+        self._ring[(self._head + self._size) % self.maxsize] = item
+        self._size += 1
+        if self._depths is not None:
+            self._depths[self._depth_slot] += 1
+        if self._size == 1:
+            self._not_empty.set()
+        if self._size == self.maxsize:
+            self._not_full.clear()
+
+    async def put(self, item: T) -> None:
+        while self._size >= self.maxsize:
+            await self._not_full.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self) -> T:
+        if self._size == 0:
+            raise asyncio.QueueEmpty
+        item = self._ring[self._head]
+        self._ring[self._head] = None
+        self._head = (self._head + 1) % self.maxsize
+        self._size -= 1
+        if self._depths is not None:
+            self._depths[self._depth_slot] -= 1
+        if self._size == 0:
+            self._not_empty.clear()
+        if self._size == self.maxsize - 1:
+            self._not_full.set()
+        return item  # type: ignore[return-value]
+
+    async def get(self) -> T:
+        while self._size == 0:
+            await self._not_empty.wait()
+        return self.get_nowait()
+
+    async def get_batch(self, max_items: int) -> list[T]:
+        while self._size == 0:
+            await self._not_empty.wait()
+        return [self.get_nowait() for _ in range(min(max_items, self._size))]
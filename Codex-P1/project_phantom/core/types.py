@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass, field
+from functools import cached_property
 from typing import Any, AsyncIterator, Literal, Optional, Protocol
 
 Direction = Literal["LONG", "SHORT"]
@@ -11,7 +12,7 @@ ExecutionEventType = Literal["EXECUTION_EVENT"]
 EventType = Literal["TRAP_SETUP_EVENT", "ABSORPTION_EVENT", "PRE_PUMP_EVENT", "EXECUTION_EVENT"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeSnapshot:
     exchange: str
     symbol: str
@@ -23,13 +24,13 @@ class ExchangeSnapshot:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OIObservation:
     ts_ms: int
     open_interest: float
 
 
-@dataclass
+@dataclass(slots=True)
 class LiquidationUpdate:
     exchange: str
     symbol: str
@@ -40,7 +41,7 @@ class LiquidationUpdate:
     ts_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class SignalBreakdown:
     liquidation_long: float
     liquidation_short: float
@@ -54,7 +55,7 @@ class SignalBreakdown:
         return (self.liquidation_short, self.funding_oi_short, self.oi_divergence)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrapSetupEvent:
     event_type: TrapEventType
     event_id: str
@@ -69,12 +70,10 @@ class TrapSetupEvent:
     degrade_reason: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
-        payload = asdict(self)
-        payload["components"] = asdict(self.components)
-        return payload
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCounters:
     reconnects: dict[str, int] = field(default_factory=dict)
     stale_cycles: int = 0
@@ -90,7 +89,7 @@ class HealthCounters:
         self.last_emitted_ts_ms = ts_ms
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeTick:
     exchange: str
     symbol: str
@@ -104,7 +103,7 @@ class TradeTick:
         return self.price * self.quantity
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookTick:
     exchange: str
     symbol: str
@@ -122,14 +121,14 @@ class OrderBookTick:
         return ((self.ask_price - self.bid_price) / mid) * 10_000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class StablecoinFlowObservation:
     source: str
     inflow_usd: float
     ts_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AbsorptionBreakdown:
     whale_net_flow_long: float
     whale_net_flow_short: float
@@ -170,7 +169,7 @@ class AbsorptionBreakdown:
         return self.hidden_divergence_short
 
 
-@dataclass
+@dataclass(slots=True)
 class AbsorptionEvent:
     event_type: AbsorptionEventType
     event_id: str
@@ -186,12 +185,10 @@ class AbsorptionEvent:
     degrade_reason: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
-        payload = asdict(self)
-        payload["components"] = asdict(self.components)
-        return payload
+        return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Candle:
     open_time_ms: int
     open: float
@@ -202,7 +199,7 @@ class Candle:
     close_time_ms: int
 
 
-@dataclass
+@dataclass(slots=True)
 class IgnitionBreakdown:
     choch: bool
     order_block: bool
@@ -240,12 +237,26 @@ class PrePumpEvent:
     degrade_reason: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
-        payload = asdict(self)
-        payload["components"] = asdict(self.components)
-        return payload
+        return asdict(self)
 
+    # Parsed once per event and shared by the planner and the Telegram formatter.
+    @cached_property
+    def source_absorption_raw(self) -> dict[str, Any]:
+        data = self.raw.get("source_absorption_raw")
+        return data if isinstance(data, dict) else {}
 
-@dataclass
+    @cached_property
+    def source_trap_raw(self) -> dict[str, Any]:
+        data = self.source_absorption_raw.get("source_trap_raw")
+        return data if isinstance(data, dict) else {}
+
+    @cached_property
+    def absorption_components(self) -> dict[str, Any]:
+        data = self.raw.get("source_absorption_components")
+        return data if isinstance(data, dict) else {}
+
+
+@dataclass(slots=True)
 class ExecutionPlan:
     entry: float
     sl: float
@@ -259,7 +270,7 @@ class ExecutionPlan:
     risk_amount: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionEvent:
     event_type: ExecutionEventType
     event_id: str
@@ -275,9 +286,7 @@ class ExecutionEvent:
     degrade_reason: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
-        payload = asdict(self)
-        payload["plan"] = asdict(self.plan)
-        return payload
+        return asdict(self)
 
 
 class ExchangeClient(Protocol):
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import time
 from typing import AsyncIterator
 
 import aiohttp
 
 from project_phantom.config import ExchangeEndpoints
+from project_phantom.core.clock import now_ms
+from project_phantom.core.jsonio import json_loads
 from project_phantom.core.types import ExchangeSnapshot, LiquidationUpdate
 
 
@@ -30,7 +31,7 @@ class BinanceClient:
             premium_resp.raise_for_status()
             premium_payload = await premium_resp.json()
 
-        ts_ms = int(premium_payload.get("time", int(time.time() * 1000)))
+        ts_ms = int(premium_payload.get("time") or now_ms())
         return ExchangeSnapshot(
             exchange=self.name,
             symbol=symbol,
@@ -49,7 +50,7 @@ class BinanceClient:
                 if msg.type != aiohttp.WSMsgType.TEXT:
                     continue
 
-                payload = msg.json()
+                payload = msg.json(loads=json_loads)
                 event = payload.get("data", payload)
                 order = event.get("o", {})
                 if order.get("s") != symbol:
@@ -60,7 +61,7 @@ class BinanceClient:
                 price = float(order.get("p", 0.0))
                 qty = float(order.get("q", 0.0))
                 notional = price * qty
-                ts_ms = int(order.get("T", int(time.time() * 1000)))
+                ts_ms = int(order.get("T") or now_ms())
 
                 yield LiquidationUpdate(
                     exchange=self.name,
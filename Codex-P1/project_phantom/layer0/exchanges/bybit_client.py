@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import time
 from typing import AsyncIterator
 
 import aiohttp
 
 from project_phantom.config import ExchangeEndpoints
+from project_phantom.core.clock import now_ms
+from project_phantom.core.jsonio import json_loads
 from project_phantom.core.types import ExchangeSnapshot, LiquidationUpdate
 
 
@@ -43,7 +44,7 @@ class BybitClient:
 
         oi_row = oi_rows[0]
         ticker_row = ticker_rows[0]
-        ts_ms = int(oi_row.get("timestamp", int(time.time() * 1000)))
+        ts_ms = int(oi_row.get("timestamp") or now_ms())
 
         return ExchangeSnapshot(
             exchange=self.name,
@@ -65,7 +66,7 @@ class BybitClient:
                 if msg.type != aiohttp.WSMsgType.TEXT:
                     continue
 
-                payload = msg.json()
+                payload = msg.json(loads=json_loads)
                 if payload.get("topic") != f"allLiquidation.{symbol}":
                     continue
 
@@ -75,7 +76,7 @@ class BybitClient:
                     liquidated_side = "LONG" if side == "SELL" else "SHORT"
                     price = float(row.get("price", 0.0))
                     qty = float(row.get("size", 0.0))
-                    ts_ms = int(row.get("updatedTime", row.get("T", int(time.time() * 1000))))
+                    ts_ms = int(row.get("updatedTime") or row.get("T") or now_ms())
                     yield LiquidationUpdate(
                         exchange=self.name,
                         symbol=symbol,
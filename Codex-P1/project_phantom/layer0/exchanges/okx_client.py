@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from typing import AsyncIterator
 
 import aiohttp
 
 from project_phantom.config import ExchangeEndpoints
+from project_phantom.core.clock import now_ms
 from project_phantom.core.types import ExchangeSnapshot, LiquidationUpdate
 
 
@@ -50,7 +50,7 @@ class OkxClient:
         oi_row = oi_payload.get("data", [{}])[0]
         funding_row = funding_payload.get("data", [{}])[0]
         mark_row = mark_payload.get("data", [{}])[0]
-        ts_ms = int(mark_row.get("ts", int(time.time() * 1000)))
+        ts_ms = int(mark_row.get("ts") or now_ms())
 
         return ExchangeSnapshot(
             exchange=self.name,
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import math
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
 
-from project_phantom.core.types import Direction, LiquidationUpdate
+from project_phantom.core.types import LiquidationUpdate
 
 
 @dataclass
@@ -49,28 +50,40 @@ class LiquidationBook:
         self._events.append(event)
         self.prune(event.ts_ms)
 
+    def add_many(self, events: Iterable[LiquidationUpdate]) -> None:
+        latest_ts_ms: int | None = None
+        for event in events:
+            self._events.append(event)
+            if latest_ts_ms is None or event.ts_ms > latest_ts_ms:
+                latest_ts_ms = event.ts_ms
+        if latest_ts_ms is not None:
+            self.prune(latest_ts_ms)
+
     def prune(self, now_ms: int) -> None:
         cutoff = now_ms - self._window_ms
         while self._events and self._events[0].ts_ms < cutoff:
             self._events.popleft()
 
-    def _bucket(self, price: float) -> float:
-        return math.floor(price / self._bin_size) * self._bin_size
-
-    def _decayed_bins(self, target_side: Direction, now_ms: int) -> dict[float, float]:
-        buckets: dict[float, float] = {}
+    def _decayed_bins(self, now_ms: int) -> tuple[dict[int, float], dict[int, float]]:
+        # One pass fills both sides; each event's decay is computed exactly once.
+        # Bins are keyed by integer index and only turned back into prices per bin.
+        short_bins: dict[int, float] = {}
+        long_bins: dict[int, float] = {}
+        neg_inv_decay_ms = -1.0 / (self._decay_minutes * 60_000.0)
+        bin_size = self._bin_size
+        exp = math.exp
+        floor = math.floor
         for event in self._events:
-            if event.liquidated_side != target_side:
-                continue
-            age_minutes = max(0.0, (now_ms - event.ts_ms) / 60_000.0)
-            decay = math.exp(-age_minutes / self._decay_minutes)
-            bucket = self._bucket(event.price)
+            buckets = short_bins if event.liquidated_side == "SHORT" else long_bins
+            age_ms = now_ms - event.ts_ms
+            decay = exp(age_ms * neg_inv_decay_ms) if age_ms > 0 else 1.0
+            bucket = floor(event.price / bin_size)
             buckets[bucket] = buckets.get(bucket, 0.0) + (event.notional * decay)
-        return buckets
+        return (short_bins, long_bins)
 
     def _direction_score(
         self,
-        bins: dict[float, float],
+        bins: dict[int, float],
         current_price: float,
         need_above: bool,
     ) -> tuple[float, float | None, float]:
@@ -83,7 +96,9 @@ class LiquidationBook:
 
         best = 0.0
         best_distance: float | None = None
-        for bucket_price, weighted_notional in bins.items():
+        bin_size = self._bin_size
+        for bucket, weighted_notional in bins.items():
+            bucket_price = bucket * bin_size
             if need_above and bucket_price < current_price:
                 continue
             if not need_above and bucket_price > current_price:
@@ -100,8 +115,7 @@ class LiquidationBook:
 
     def proximity_scores(self, current_price: float, now_ms: int) -> LiquidationProximity:
         self.prune(now_ms)
-        short_liq_bins = self._decayed_bins("SHORT", now_ms)
-        long_liq_bins = self._decayed_bins("LONG", now_ms)
+        short_liq_bins, long_liq_bins = self._decayed_bins(now_ms)
 
         long_score, long_distance, short_p90 = self._direction_score(
             short_liq_bins, current_price=current_price, need_above=True
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import math
+from bisect import bisect_left, insort
 from collections import deque
-from statistics import mean
+from itertools import islice
 from typing import Sequence
 
 from project_phantom.config import AdaptiveGateConfig, RegimeFilterConfig, SignalWeights, ThresholdConfig
@@ -13,6 +14,11 @@ def clamp(value: float, lower: float = 0.0, upper: float = 1.0) -> float:
     return max(lower, min(upper, value))
 
 
+def mean_or_zero(values: Sequence[float]) -> float:
+    # statistics.mean goes through exact fractions; fsum keeps the rounding tight at C speed.
+    return math.fsum(values) / len(values) if values else 0.0
+
+
 def compute_realized_volatility(prices: Sequence[float]) -> float:
     if len(prices) < 2:
         return 0.0
@@ -35,9 +41,11 @@ def compute_ema(prices: Sequence[float], span: int) -> float:
     if span <= 1:
         return float(prices[-1])
     alpha = 2.0 / (span + 1.0)
+    decay = 1.0 - alpha
     value = float(prices[0])
-    for price in prices[1:]:
-        value = alpha * float(price) + (1.0 - alpha) * value
+    # islice avoids copying the window a second time; callers already pass a trimmed slice.
+    for price in islice(prices, 1, None):
+        value = alpha * price + decay * value
     return value
 
 
@@ -91,9 +99,9 @@ def compute_funding_oi_scores(
     ret_5m: float,
     thresholds: ThresholdConfig,
 ) -> tuple[float, float, dict[str, float | str]]:
-    avg_funding = mean(funding_rates) if funding_rates else 0.0
-    avg_oi_change = mean(oi_changes_pct) if oi_changes_pct else 0.0
-    avg_oi_accel = mean(oi_accels_pct) if oi_accels_pct else 0.0
+    avg_funding = mean_or_zero(funding_rates)
+    avg_oi_change = mean_or_zero(oi_changes_pct)
+    avg_oi_accel = mean_or_zero(oi_accels_pct)
 
     funding_long = clamp(-avg_funding / thresholds.funding_scale)
     funding_short = clamp(avg_funding / thresholds.funding_scale)
@@ -197,10 +205,34 @@ def compute_regime_scores(
     )
 
 
+class SortedScoreWindow:
+    """
+    Fixed-size FIFO of recent scores that also keeps them in sorted order, so quantiles need no per-cycle sort.
+    """
+
+    __slots__ = ("_fifo", "ranked")
+
+    def __init__(self, maxlen: int) -> None:
+        self._fifo: deque[float] = deque(maxlen=max(1, maxlen))
+        self.ranked: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._fifo)
+
+    def append(self, score: float) -> None:
+        score = float(score)
+        if len(self._fifo) == self._fifo.maxlen:
+            del self.ranked[bisect_left(self.ranked, self._fifo[0])]
+        self._fifo.append(score)
+        insort(self.ranked, score)
+
+
 def compute_adaptive_threshold(
     observed_scores: Sequence[float],
     config: AdaptiveGateConfig,
     base_threshold: float,
+    *,
+    presorted: bool = False,
 ) -> float:
     if not config.enabled:
         return base_threshold
@@ -208,7 +240,7 @@ def compute_adaptive_threshold(
     if len(observed_scores) < max(1, config.min_samples):
         return base_threshold
 
-    ranked = sorted(float(item) for item in observed_scores)
+    ranked = observed_scores if presorted else sorted(float(item) for item in observed_scores)
     quantile = clamp(config.quantile, 0.0, 1.0)
     idx = int(round((len(ranked) - 1) * quantile))
     dynamic = ranked[idx]
@@ -224,11 +256,14 @@ def compute_directional_score(
     direction: Direction,
     weights: SignalWeights,
 ) -> float:
-    liq, fund_oi, oi_div = breakdown.for_direction(direction)
+    if direction == "LONG":
+        liq, fund_oi = breakdown.liquidation_long, breakdown.funding_oi_long
+    else:
+        liq, fund_oi = breakdown.liquidation_short, breakdown.funding_oi_short
     return (
         weights.liquidation * liq
         + weights.funding_oi * fund_oi
-        + weights.oi_divergence * oi_div
+        + weights.oi_divergence * breakdown.oi_divergence
     )
 
 
@@ -242,9 +277,13 @@ def passes_gate(
     active_threshold = threshold.score_threshold if score_threshold_override is None else score_threshold_override
     if score < active_threshold:
         return False
-    components = breakdown.for_direction(direction)
-    passing_components = sum(item >= threshold.component_threshold for item in components)
-    return passing_components >= 2
+    component_threshold = threshold.component_threshold
+    if direction == "LONG":
+        liq, fund_oi = breakdown.liquidation_long, breakdown.funding_oi_long
+    else:
+        liq, fund_oi = breakdown.liquidation_short, breakdown.funding_oi_short
+    hits = (liq >= component_threshold) + (fund_oi >= component_threshold)
+    return hits + (breakdown.oi_divergence >= component_threshold) >= 2
 
 
 def has_warmup_window(history_map: dict[str, deque[OIObservation]], now_ms: int, warmup_ms: int) -> bool:
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import time
-import uuid
 from collections import deque
 from dataclasses import dataclass, field
-from statistics import mean
 from typing import Any
 
 from project_phantom.config import Layer0Config
+from project_phantom.core.clock import now_ms as _now_ms
+from project_phantom.core.ids import new_event_id
 from project_phantom.core.types import (
     ExchangeClient,
     ExchangeSnapshot,
@@ -20,6 +19,7 @@ from project_phantom.core.types import (
 )
 from project_phantom.layer0.liquidation_book import LiquidationBook
 from project_phantom.layer0.signals import (
+    SortedScoreWindow,
     compute_adaptive_threshold,
     compute_directional_score,
     compute_funding_oi_scores,
@@ -30,14 +30,11 @@ from project_phantom.layer0.signals import (
     compute_realized_volatility,
     compute_return,
     has_warmup_window,
+    mean_or_zero,
     passes_gate,
 )
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
-
-
 def _error_reason(exchange: str, exc: Exception) -> str:
     detail = str(exc)
     if exchange == "bybit" and "403" in detail:
@@ -79,7 +76,7 @@ async def _emit_with_drop_oldest(
         with contextlib.suppress(asyncio.QueueEmpty):
             out_queue.get_nowait()
             health.queue_drops += 1
-    await out_queue.put(event)
+    out_queue.put_nowait(event)
 
 
 async def _snapshot_poller(
@@ -211,7 +208,7 @@ async def _scoring_loop(
     price_history: deque[tuple[int, float]],
 ) -> None:
     configured_exchanges = list(states.keys())
-    score_history: deque[float] = deque(maxlen=max(1, config.adaptive_gate.window_cycles))
+    score_window = SortedScoreWindow(config.adaptive_gate.window_cycles)
     while not stop_event.is_set():
         cycle_start_ms = _now_ms()
         stale_names: list[str] = []
@@ -275,7 +272,7 @@ async def _scoring_loop(
         elif active_snapshots:
             mark_prices = [snap.mark_price for snap in active_snapshots.values() if snap.mark_price is not None]
             if mark_prices:
-                current_price = mean(mark_prices)
+                current_price = mean_or_zero(mark_prices)
 
         if current_price <= 0:
             if await _sleep_or_stop(stop_event, config.cadence_seconds):
@@ -292,9 +289,10 @@ async def _scoring_loop(
             regime=config.regime,
         )
         adaptive_threshold = compute_adaptive_threshold(
-            observed_scores=list(score_history),
+            observed_scores=score_window.ranked,
             config=config.adaptive_gate,
             base_threshold=config.thresholds.score_threshold,
+            presorted=True,
         )
 
         liq = book.proximity_scores(current_price=current_price, now_ms=cycle_start_ms)
@@ -378,7 +376,7 @@ async def _scoring_loop(
             )
             event = TrapSetupEvent(
                 event_type="TRAP_SETUP_EVENT",
-                event_id=str(uuid.uuid4()),
+                event_id=new_event_id(),
                 ts_ms=cycle_start_ms,
                 symbol=config.symbol,
                 direction=direction,
@@ -392,7 +390,7 @@ async def _scoring_loop(
             await _emit_with_drop_oldest(out_queue, event, health)
             health.mark_emitted(cycle_start_ms)
 
-        score_history.append(max(score_long, score_short))
+        score_window.append(max(score_long, score_short))
 
         if await _sleep_or_stop(stop_event, config.cadence_seconds):
             return
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import time
-import uuid
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
 from project_phantom.config import Layer1Config
+from project_phantom.core.clock import now_ms as _now_ms
+from project_phantom.core.ids import new_event_id
 from project_phantom.core.types import (
     AbsorptionBreakdown,
     AbsorptionEvent,
@@ -25,18 +25,12 @@ from project_phantom.layer1.metrics import (
     compute_absorption_score,
     compute_cvd_scores,
     compute_orderbook_imbalance_scores,
-    compute_sweep_aggression_scores,
     compute_stablecoin_inflow_score,
-    compute_twap_uniformity_scores,
-    compute_whale_net_flow_scores,
+    compute_trade_flow_scores,
     passes_absorption_gate,
 )
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
-
-
 @dataclass
 class _Layer1State:
     active_setup: TrapSetupEvent | None = None
@@ -79,7 +73,7 @@ async def _emit_with_drop_oldest(
         with contextlib.suppress(asyncio.QueueEmpty):
             out_queue.get_nowait()
             health.queue_drops += 1
-    await out_queue.put(event)
+    out_queue.put_nowait(event)
 
 
 async def _trap_setup_consumer(
@@ -199,30 +193,21 @@ async def _scoring_loop(
                 return
             continue
 
-        trades = list(state.trades)
+        # Metrics read the windows in place; nothing awaits until the event is built.
+        trades = state.trades
         if len(trades) < config.min_trades_for_metrics:
             if await _sleep_or_stop(stop_event, config.cadence_seconds):
                 return
             continue
 
-        whale_long, whale_short, whale_net_flow = compute_whale_net_flow_scores(
-            trades=trades,
-            min_notional=config.thresholds.whale_notional_usd,
-            scale_usd=config.thresholds.whale_flow_scale_usd,
-        )
-        twap_long, twap_short, twap_cv, whale_count = compute_twap_uniformity_scores(
-            trades=trades,
-            min_notional=config.thresholds.whale_notional_usd,
-            cv_limit=config.thresholds.twap_interval_cv_limit,
-        )
+        whale, twap, sweep = compute_trade_flow_scores(trades, config.thresholds)
+        whale_long, whale_short, whale_net_flow = whale
+        twap_long, twap_short, twap_cv, whale_count = twap
+        sweep_long, sweep_short, max_buy_sweep, max_sell_sweep = sweep
         cvd_long, cvd_short, cvd_delta, price_delta_pct, hidden_long, hidden_short = compute_cvd_scores(
             trades=trades,
             cvd_scale_usd=config.thresholds.cvd_scale_usd,
         )
-        sweep_long, sweep_short, max_buy_sweep, max_sell_sweep = compute_sweep_aggression_scores(
-            trades=trades,
-            scale_usd=config.thresholds.sweep_aggression_scale_usd,
-        )
 
         degraded_reasons: list[str] = []
         stablecoin_usd = 0.0
@@ -234,7 +219,7 @@ async def _scoring_loop(
         orderbook_short = 0.0
 
         if config.enable_binance_orderbook:
-            books = list(state.books)
+            books = state.books
             if not books:
                 degraded = True
                 degraded_reasons.append("ORDERBOOK_NO_DATA")
@@ -289,7 +274,7 @@ async def _scoring_loop(
         if passed:
             event = AbsorptionEvent(
                 event_type="ABSORPTION_EVENT",
-                event_id=str(uuid.uuid4()),
+                event_id=new_event_id(),
                 ts_ms=now_ms,
                 symbol=config.symbol,
                 direction=direction,
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import time
 from typing import AsyncIterator
 
 import aiohttp
 
 from project_phantom.config import ExchangeEndpoints
+from project_phantom.core.clock import now_ms
+from project_phantom.core.jsonio import json_loads
 from project_phantom.core.types import OrderBookTick
 
 
@@ -26,7 +27,7 @@ class BinanceBookClient:
                 if msg.type != aiohttp.WSMsgType.TEXT:
                     continue
 
-                payload = msg.json()
+                payload = msg.json(loads=json_loads)
                 event_symbol = str(payload.get("s", "")).upper()
                 if event_symbol != symbol.upper():
                     continue
@@ -38,7 +39,7 @@ class BinanceBookClient:
                     bid_qty=float(payload.get("B", 0.0)),
                     ask_price=float(payload.get("a", 0.0)),
                     ask_qty=float(payload.get("A", 0.0)),
-                    ts_ms=int(payload.get("E", int(time.time() * 1000))),
+                    ts_ms=int(payload.get("E") or now_ms()),
                 )
 
     async def close(self) -> None:
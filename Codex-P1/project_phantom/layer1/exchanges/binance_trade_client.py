@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import time
 from typing import AsyncIterator
 
 import aiohttp
 
 from project_phantom.config import ExchangeEndpoints
+from project_phantom.core.clock import now_ms
+from project_phantom.core.jsonio import json_loads
 from project_phantom.core.types import TradeTick
 
 
@@ -26,7 +27,7 @@ class BinanceTradeClient:
                 if msg.type != aiohttp.WSMsgType.TEXT:
                     continue
 
-                payload = msg.json()
+                payload = msg.json(loads=json_loads)
                 if payload.get("e") != "trade":
                     continue
 
@@ -40,7 +41,7 @@ class BinanceTradeClient:
                     price=float(payload["p"]),
                     quantity=float(payload["q"]),
                     is_buyer_maker=bool(payload["m"]),
-                    ts_ms=int(payload.get("T", payload.get("E", int(time.time() * 1000)))),
+                    ts_ms=int(payload.get("T") or payload.get("E") or now_ms()),
                 )
                 yield trade
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from itertools import islice
 from typing import Sequence
 
 from project_phantom.config import Layer1ThresholdConfig, Layer1Weights
@@ -21,8 +22,15 @@ def compute_whale_net_flow_scores(
     min_notional: float,
     scale_usd: float,
 ) -> tuple[float, float, float]:
-    whale_trades = [trade for trade in trades if trade.notional >= min_notional]
-    net_flow = sum(signed_notional(trade) for trade in whale_trades)
+    net_flow = 0.0
+    for trade in trades:
+        notional = trade.price * trade.quantity
+        if notional >= min_notional:
+            net_flow += -notional if trade.is_buyer_maker else notional
+    return _whale_net_flow_scores(net_flow, scale_usd)
+
+
+def _whale_net_flow_scores(net_flow: float, scale_usd: float) -> tuple[float, float, float]:
     long_score = clamp(max(net_flow, 0.0) / scale_usd) if scale_usd > 0 else 0.0
     short_score = clamp(max(-net_flow, 0.0) / scale_usd) if scale_usd > 0 else 0.0
     return (long_score, short_score, net_flow)
@@ -34,30 +42,43 @@ def compute_twap_uniformity_scores(
     cv_limit: float,
 ) -> tuple[float, float, float | None, int]:
     whale_trades = [trade for trade in trades if trade.notional >= min_notional]
+    return _twap_uniformity_scores(whale_trades, cv_limit)
+
+
+def _twap_uniformity_scores(
+    whale_trades: list[TradeTick],
+    cv_limit: float,
+) -> tuple[float, float, float | None, int]:
     if len(whale_trades) < 3:
         return (0.0, 0.0, None, len(whale_trades))
 
     ordered = sorted(whale_trades, key=lambda row: row.ts_ms)
-    intervals = [
-        (ordered[idx].ts_ms - ordered[idx - 1].ts_ms) / 1000.0
-        for idx in range(1, len(ordered))
-    ]
-    if not intervals:
-        return (0.0, 0.0, None, len(whale_trades))
+    # Welford's update gives the interval mean and variance in the same walk that counts buyers.
+    prev_ts_ms = ordered[0].ts_ms
+    buy_aggressive = 0 if ordered[0].is_buyer_maker else 1
+    interval_count = 0
+    mean_interval = 0.0
+    sq_dev_sum = 0.0
+    for trade in islice(ordered, 1, None):
+        interval = (trade.ts_ms - prev_ts_ms) / 1000.0
+        prev_ts_ms = trade.ts_ms
+        interval_count += 1
+        delta = interval - mean_interval
+        mean_interval += delta / interval_count
+        sq_dev_sum += delta * (interval - mean_interval)
+        if not trade.is_buyer_maker:
+            buy_aggressive += 1
 
-    mean_interval = sum(intervals) / len(intervals)
     if mean_interval <= 0:
         return (0.0, 0.0, None, len(whale_trades))
 
-    variance = sum((value - mean_interval) ** 2 for value in intervals) / len(intervals)
-    cv = math.sqrt(variance) / mean_interval
+    cv = math.sqrt(sq_dev_sum / interval_count) / mean_interval
 
     if cv_limit <= 0:
         uniformity = 0.0
     else:
         uniformity = clamp(1.0 - (cv / cv_limit))
 
-    buy_aggressive = sum(1 for trade in whale_trades if not trade.is_buyer_maker)
     sell_aggressive = len(whale_trades) - buy_aggressive
     if len(whale_trades) <= 0:
         return (0.0, 0.0, cv, len(whale_trades))
@@ -74,10 +95,17 @@ def compute_cvd_scores(
     if len(trades) < 2:
         return (0.0, 0.0, 0.0, 0.0, False, False)
 
-    ordered = sorted(trades, key=lambda row: row.ts_ms)
-    cvd_delta = sum(signed_notional(trade) for trade in ordered)
-    start_price = ordered[0].price
-    end_price = ordered[-1].price
+    # CVD is order-independent, so one pass replaces the sort; ties resolve like a stable sort would.
+    first = last = trades[0]
+    cvd_delta = 0.0
+    for trade in trades:
+        cvd_delta += -trade.notional if trade.is_buyer_maker else trade.notional
+        if trade.ts_ms < first.ts_ms:
+            first = trade
+        if trade.ts_ms >= last.ts_ms:
+            last = trade
+    start_price = first.price
+    end_price = last.price
     if start_price <= 0:
         price_delta_pct = 0.0
     else:
@@ -110,21 +138,29 @@ def compute_orderbook_imbalance_scores(
     if not books or imbalance_scale <= 0:
         return (0.0, 0.0, 0.0, 0.0)
 
-    imbalances: list[float] = []
-    spreads: list[float] = []
+    imbalance_sum = 0.0
+    spread_sum = 0.0
+    count = 0
     for book in books:
-        denom = book.bid_qty + book.ask_qty
+        bid_qty = book.bid_qty
+        ask_qty = book.ask_qty
+        denom = bid_qty + ask_qty
         if denom <= 0:
             continue
-        imbalance = (book.bid_qty - book.ask_qty) / denom
-        imbalances.append(imbalance)
-        spreads.append(book.spread_bps)
-
-    if not imbalances:
+        imbalance_sum += (bid_qty - ask_qty) / denom
+        # Same arithmetic as OrderBookTick.spread_bps, without the per-book property call.
+        bid_price = book.bid_price
+        ask_price = book.ask_price
+        mid = (bid_price + ask_price) / 2.0
+        if mid > 0:
+            spread_sum += ((ask_price - bid_price) / mid) * 10_000.0
+        count += 1
+
+    if not count:
         return (0.0, 0.0, 0.0, 0.0)
 
-    avg_imbalance = sum(imbalances) / len(imbalances)
-    avg_spread_bps = sum(spreads) / len(spreads) if spreads else 0.0
+    avg_imbalance = imbalance_sum / count
+    avg_spread_bps = spread_sum / count
     long_score = clamp(max(avg_imbalance, 0.0) / imbalance_scale)
     short_score = clamp(max(-avg_imbalance, 0.0) / imbalance_scale)
     return (long_score, short_score, avg_imbalance, avg_spread_bps)
@@ -139,9 +175,13 @@ def compute_sweep_aggression_scores(
 
     per_second: dict[int, float] = {}
     for trade in trades:
-        bucket = int(trade.ts_ms // 1000)
-        per_second[bucket] = per_second.get(bucket, 0.0) + signed_notional(trade)
+        notional = trade.price * trade.quantity
+        bucket = trade.ts_ms // 1000
+        per_second[bucket] = per_second.get(bucket, 0.0) + (-notional if trade.is_buyer_maker else notional)
+    return _sweep_aggression_scores(per_second, scale_usd)
+
 
+def _sweep_aggression_scores(per_second: dict[int, float], scale_usd: float) -> tuple[float, float, float, float]:
     if not per_second:
         return (0.0, 0.0, 0.0, 0.0)
 
@@ -152,21 +192,68 @@ def compute_sweep_aggression_scores(
     return (long_score, short_score, max_buy_sweep, max_sell_sweep)
 
 
+def compute_trade_flow_scores(
+    trades: Sequence[TradeTick],
+    thresholds: Layer1ThresholdConfig,
+) -> tuple[
+    tuple[float, float, float],
+    tuple[float, float, float | None, int],
+    tuple[float, float, float, float],
+]:
+    """
+    Whale net flow, TWAP uniformity and sweep aggression from a single walk over the trades.
+    """
+    min_notional = thresholds.whale_notional_usd
+    net_flow = 0.0
+    whale_trades: list[TradeTick] = []
+    per_second: dict[int, float] = {}
+    for trade in trades:
+        notional = trade.price * trade.quantity
+        signed = -notional if trade.is_buyer_maker else notional
+        if notional >= min_notional:
+            net_flow += signed
+            whale_trades.append(trade)
+        bucket = trade.ts_ms // 1000
+        per_second[bucket] = per_second.get(bucket, 0.0) + signed
+
+    sweep_scale_usd = thresholds.sweep_aggression_scale_usd
+    if len(trades) < 2 or sweep_scale_usd <= 0:
+        sweep = (0.0, 0.0, 0.0, 0.0)
+    else:
+        sweep = _sweep_aggression_scores(per_second, sweep_scale_usd)
+    return (
+        _whale_net_flow_scores(net_flow, thresholds.whale_flow_scale_usd),
+        _twap_uniformity_scores(whale_trades, thresholds.twap_interval_cv_limit),
+        sweep,
+    )
+
+
 def compute_absorption_score(
     breakdown: AbsorptionBreakdown,
     direction: Direction,
     weights: Layer1Weights,
 ) -> float:
-    whale_flow, twap, cvd, stablecoin, orderbook_imbalance, sweep_aggression = breakdown.score_components(direction)
-    score = (
-        weights.whale_net_flow * whale_flow
-        + weights.twap_uniformity * twap
-        + weights.cvd * cvd
-        + weights.stablecoin_inflow * stablecoin
-        + weights.orderbook_imbalance * orderbook_imbalance
-        + weights.sweep_aggression * sweep_aggression
-    )
-    if breakdown.hidden_divergence_for(direction):
+    if direction == "LONG":
+        score = (
+            weights.whale_net_flow * breakdown.whale_net_flow_long
+            + weights.twap_uniformity * breakdown.twap_uniformity_long
+            + weights.cvd * breakdown.cvd_long
+            + weights.stablecoin_inflow * breakdown.stablecoin_inflow
+            + weights.orderbook_imbalance * breakdown.orderbook_imbalance_long
+            + weights.sweep_aggression * breakdown.sweep_aggression_long
+        )
+        hidden_divergence = breakdown.hidden_divergence_long
+    else:
+        score = (
+            weights.whale_net_flow * breakdown.whale_net_flow_short
+            + weights.twap_uniformity * breakdown.twap_uniformity_short
+            + weights.cvd * breakdown.cvd_short
+            + weights.stablecoin_inflow * breakdown.stablecoin_inflow
+            + weights.orderbook_imbalance * breakdown.orderbook_imbalance_short
+            + weights.sweep_aggression * breakdown.sweep_aggression_short
+        )
+        hidden_divergence = breakdown.hidden_divergence_short
+    if hidden_divergence:
         score += 0.1
     return clamp(score)
 
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import time
-import uuid
 from dataclasses import asdict
 from dataclasses import dataclass
 from typing import Any
 
 from project_phantom.config import Layer2Config
+from project_phantom.core.clock import now_ms as _now_ms
+from project_phantom.core.ids import new_event_id
 from project_phantom.core.types import (
     AbsorptionEvent,
     Candle,
@@ -21,10 +21,6 @@ from project_phantom.layer2.signals import build_ignition_breakdown
 from project_phantom.layer2.smc_detector import SmartMoneyConceptsDetector
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
-
-
 @dataclass
 class _Layer2State:
     active_absorption: AbsorptionEvent | None = None
@@ -52,7 +48,7 @@ async def _emit_with_drop_oldest(
         with contextlib.suppress(asyncio.QueueEmpty):
             out_queue.get_nowait()
             health.queue_drops += 1
-    await out_queue.put(event)
+    out_queue.put_nowait(event)
 
 
 async def _absorption_consumer(
@@ -167,7 +163,7 @@ async def _scoring_loop(
             score = breakdown.confirmations / 5.0
             event = PrePumpEvent(
                 event_type="PRE_PUMP_EVENT",
-                event_id=str(uuid.uuid4()),
+                event_id=new_event_id(),
                 ts_ms=now_ms,
                 symbol=config.symbol,
                 direction=absorption.direction,
@@ -215,7 +211,11 @@ async def run_layer2(
     if health is None:
         health = HealthCounters()
     if smc_detector is None:
-        smc_detector = SmartMoneyConceptsDetector()
+        default_detector = SmartMoneyConceptsDetector()
+        if config.enable_smartmoneyconcepts:
+            # Pay the backend import at startup instead of on the first scoring cycle.
+            await asyncio.to_thread(default_detector.warmup)
+        smc_detector = default_detector
 
     state = _Layer2State()
 
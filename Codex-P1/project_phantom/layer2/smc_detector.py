@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from project_phantom.core.types import Candle, Direction
@@ -53,18 +54,31 @@ def _heuristic_signals(candles: list[Candle], direction: Direction) -> tuple[boo
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_backend() -> tuple[Any, Any] | None:
+    # pandas + smartmoneyconcepts take seconds to import; cache so only the first caller pays.
+    try:
+        import pandas as pd  # type: ignore
+        from smartmoneyconcepts import smc  # type: ignore
+    except ModuleNotFoundError:
+        return None
+    return (pd, smc)
+
+
 class SmartMoneyConceptsDetector:
     name = "smartmoneyconcepts"
 
+    def warmup(self) -> bool:
+        return _load_backend() is not None
+
     async def detect(self, candles: list[Candle], direction: Direction) -> tuple[bool, bool, dict[str, Any]]:
         if len(candles) < 12:
             return _heuristic_signals(candles, direction)
 
-        try:
-            import pandas as pd  # type: ignore
-            from smartmoneyconcepts import smc  # type: ignore
-        except ModuleNotFoundError:
+        backend = _load_backend()
+        if backend is None:
             return _heuristic_signals(candles, direction)
+        pd, smc = backend
 
         df = pd.DataFrame(
             {
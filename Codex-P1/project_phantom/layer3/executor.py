@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import time
-import uuid
 from collections import deque
 from typing import Any
 
 from project_phantom.config import Layer3Config
+from project_phantom.core.clock import now_ms as _now_ms
+from project_phantom.core.ids import new_event_id
 from project_phantom.core.types import (
     ExecutionEvent,
+    ExecutionPlan,
     FuturesExecutionClient,
     HealthCounters,
     PrePumpEvent,
@@ -19,14 +20,8 @@ from project_phantom.layer3.planner import build_execution_plan, derive_adaptive
 from project_phantom.layer3.telegram_formatter import format_telegram_signal
 
 
-def _now_ms() -> int:
-    return int(time.time() * 1000)
-
-
-def _side_from_direction(direction: str) -> tuple[str, str]:
-    if direction == "LONG":
-        return ("BUY", "SELL")
-    return ("SELL", "BUY")
+# (entry_side, exit_side) per direction; looked up on the order-submission path.
+_SIDES: dict[str, tuple[str, str]] = {"LONG": ("BUY", "SELL"), "SHORT": ("SELL", "BUY")}
 
 
 def _extract_entry_price(order_response: dict[str, Any]) -> float | None:
@@ -68,7 +63,7 @@ async def _emit_with_drop_oldest(
         with contextlib.suppress(asyncio.QueueEmpty):
             out_queue.get_nowait()
             health.queue_drops += 1
-    await out_queue.put(event)
+    out_queue.put_nowait(event)
 
 
 async def _place_execution_orders(
@@ -76,8 +71,8 @@ async def _place_execution_orders(
     event: PrePumpEvent,
     client: FuturesExecutionClient,
     quantity: float,
-) -> tuple[dict[str, str], dict[str, Any], float]:
-    entry_side, exit_side = _side_from_direction(event.direction)
+) -> tuple[dict[str, str], dict[str, Any], ExecutionPlan]:
+    entry_side, exit_side = _SIDES[event.direction]
 
     entry_response = await client.futures_create_order(
         symbol=config.symbol,
@@ -106,6 +101,7 @@ async def _place_execution_orders(
     if tp2_qty <= 0:
         tp2_qty = round(quantity, 6)
 
+    # The stop must be resting before any take-profit goes out: a rejected SL aborts with no TPs left behind.
     sl_response = await client.futures_create_order(
         symbol=config.symbol,
         side=exit_side,
@@ -115,24 +111,35 @@ async def _place_execution_orders(
         reduceOnly=True,
         workingType="MARK_PRICE",
     )
-    tp1_response = await client.futures_create_order(
-        symbol=config.symbol,
-        side=exit_side,
-        type="TAKE_PROFIT_MARKET",
-        stopPrice=plan.tp1,
-        quantity=tp1_qty,
-        reduceOnly=True,
-        workingType="MARK_PRICE",
-    )
-    tp2_response = await client.futures_create_order(
-        symbol=config.symbol,
-        side=exit_side,
-        type="TAKE_PROFIT_MARKET",
-        stopPrice=plan.tp2,
-        quantity=tp2_qty,
-        reduceOnly=True,
-        workingType="MARK_PRICE",
+    # The two take-profits are independent of each other, so they go out together; a rejection on
+    # one must still surface the sibling that went live, since nothing else will track it.
+    tp1_response, tp2_response = await asyncio.gather(
+        client.futures_create_order(
+            symbol=config.symbol,
+            side=exit_side,
+            type="TAKE_PROFIT_MARKET",
+            stopPrice=plan.tp1,
+            quantity=tp1_qty,
+            reduceOnly=True,
+            workingType="MARK_PRICE",
+        ),
+        client.futures_create_order(
+            symbol=config.symbol,
+            side=exit_side,
+            type="TAKE_PROFIT_MARKET",
+            stopPrice=plan.tp2,
+            quantity=tp2_qty,
+            reduceOnly=True,
+            workingType="MARK_PRICE",
+        ),
+        return_exceptions=True,
     )
+    tp_results = (("tp1", tp1_response), ("tp2", tp2_response))
+    tp_errors = [f"{name}: {result}" for name, result in tp_results if isinstance(result, BaseException)]
+    if tp_errors:
+        live = [f"entry={_order_id(entry_response)}", f"sl={_order_id(sl_response)}"]
+        live.extend(f"{name}={_order_id(result)}" for name, result in tp_results if not isinstance(result, BaseException))
+        raise RuntimeError(f"Take-profit rejected ({'; '.join(tp_errors)}); live orders: {' '.join(live)}")
 
     order_ids = {
         "entry": _order_id(entry_response),
@@ -140,7 +147,7 @@ async def _place_execution_orders(
         "tp1": _order_id(tp1_response),
         "tp2": _order_id(tp2_response),
     }
-    return (order_ids, {"entry": entry_response, "sl": sl_response, "tp1": tp1_response, "tp2": tp2_response}, entry_price)
+    return (order_ids, {"entry": entry_response, "sl": sl_response, "tp1": tp1_response, "tp2": tp2_response}, plan)
 
 
 async def run_layer3(
@@ -206,7 +213,6 @@ async def run_layer3(
         degraded_reasons: list[str] = []
         order_ids: dict[str, str] = {}
         execution_raw: dict[str, Any] = {}
-        plan = None
         quantity, confidence = derive_adaptive_quantity(
             event,
             base_quantity=config.fixed_quantity,
@@ -220,7 +226,7 @@ async def run_layer3(
             if config.enable_execution and config.execution_mode.lower() == "live":
                 if active_execution_client is None:
                     raise RuntimeError("Execution client is required for live mode")
-                order_ids, execution_raw, entry_price = await _place_execution_orders(
+                order_ids, execution_raw, plan = await _place_execution_orders(
                     config,
                     event,
                     active_execution_client,
@@ -239,14 +245,6 @@ async def run_layer3(
                 order_ids = {"entry": "paper-entry", "sl": "paper-sl", "tp1": "paper-tp1", "tp2": "paper-tp2"}
                 execution_raw = {"mode": "paper"}
 
-            if plan is None:
-                plan = build_execution_plan(
-                    event,
-                    entry_price=entry_price,
-                    quantity=quantity,
-                    risk_config=config.risk,
-                )
-
             if active_telegram_notifier is not None and config.telegram.enabled:
                 try:
                     message = format_telegram_signal(event, plan, order_ids=order_ids)
@@ -257,7 +255,7 @@ async def run_layer3(
 
             execution_event = ExecutionEvent(
                 event_type="EXECUTION_EVENT",
-                event_id=str(uuid.uuid4()),
+                event_id=new_event_id(),
                 ts_ms=_now_ms(),
                 symbol=config.symbol,
                 direction=event.direction,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import random
 import time
-from typing import Any
+from dataclasses import astuple, dataclass
+from typing import Any, Awaitable, Callable
 
 import aiohttp
 
@@ -9,9 +12,82 @@ from project_phantom.config import ExchangeEndpoints
 from project_phantom.core.types import HealthCounters
 
 
+@dataclass
+class _HealthCache:
+    key: tuple[Any, ...] | None = None
+    result: Any = None
+    expires_at: float = 0.0
+    inflight: asyncio.Future[Any] | None = None
+    inflight_key: tuple[Any, ...] | None = None
+
+
+_PUBLIC_API_CACHE = _HealthCache()
+_BINANCE_AUTH_CACHE = _HealthCache()
+
+_REPORT_RULE = "================================"
+_REPORT_FOOTER = _REPORT_RULE + "</pre>"
+_ENV_KEYS = ("TG_BOT_TOKEN", "TG_CHAT_ID", "BINANCE_API_KEY", "BINANCE_API_SECRET")
+_API_KEYS = ("BINANCE_PUBLIC", "BYBIT_PUBLIC", "OKX_PUBLIC", "WHALE_ALERT")
+_QUEUE_LABELS = tuple((key, f"q_layer{key[1]}".ljust(21) + ": ") for key in ("l0", "l1", "l2", "l3"))
+_LAYER_LABELS = tuple((name, name.ljust(20) + ": emitted=") for name in ("layer0", "layer1", "layer2", "layer3"))
+
+_OKX_FALLBACK_TIME_URL = "https://my.okx.com/api/v5/public/time"
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=8, connect=3, sock_read=5)
+
+_SESSION: aiohttp.ClientSession | None = None
+_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    # Keep one pooled session so repeated probes reuse TCP/TLS connections and cached DNS.
+    # Creation is synchronous, so no lock is needed to keep it single-instance per loop.
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=20, ttl_dns_cache=300, keepalive_timeout=60),
+            timeout=_REQUEST_TIMEOUT,
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+
+async def close_health_session() -> None:
+    global _SESSION, _SESSION_LOOP
+    session = _SESSION
+    _SESSION = None
+    _SESSION_LOOP = None
+    if session is not None and not session.closed:
+        await session.close()
+
+
+async def _cached_call(
+    cache: _HealthCache,
+    key: tuple[Any, ...],
+    factory: Callable[[], Awaitable[Any]],
+    *,
+    ttl_seconds: float,
+    force: bool,
+) -> Any:
+    if not force and cache.key == key and time.monotonic() < cache.expires_at:
+        return cache.result
+
+    # Single-flight: concurrent callers share one in-progress run instead of re-probing.
+    inflight = cache.inflight
+    if inflight is None or inflight.done() or cache.inflight_key != key:
+        inflight = asyncio.ensure_future(factory())
+        cache.inflight = inflight
+        cache.inflight_key = key
+    result = await asyncio.shield(inflight)
+    if ttl_seconds > 0:
+        cache.key = key
+        cache.result = result
+        cache.expires_at = time.monotonic() + ttl_seconds
+    return result
+
+
 def _status_line(label: str, ok: bool, detail: str) -> str:
-    icon = "OK" if ok else "FAIL"
-    return f"{label:<20} : {icon:<4} {detail}"
+    return label.ljust(20) + (" : OK   " if ok else " : FAIL ") + detail
 
 
 def _safe_reconnect_total(counters: HealthCounters) -> int:
@@ -20,7 +96,7 @@ def _safe_reconnect_total(counters: HealthCounters) -> int:
 
 async def _simple_get_json(session: aiohttp.ClientSession, url: str, params: dict[str, Any] | None = None) -> tuple[bool, str]:
     try:
-        async with session.get(url, params=params, timeout=8) as response:
+        async with session.get(url, params=params, timeout=_REQUEST_TIMEOUT) as response:
             if response.status >= 400:
                 return (False, f"http_{response.status}")
             await response.text()
@@ -37,51 +113,73 @@ async def _check_with_retries(
     retries: int = 2,
 ) -> tuple[bool, str]:
     last_detail = "unknown"
-    for _ in range(max(1, retries)):
+    attempts = max(1, retries)
+    for attempt in range(attempts):
         ok, detail = await _simple_get_json(session, url, params=params)
         if ok:
             return (True, detail)
         last_detail = detail
+        if attempt + 1 < attempts:
+            # Exponential backoff with jitter so a flaky endpoint is not hit back-to-back.
+            await asyncio.sleep(min(2**attempt * 0.2, 2.0) * (0.5 + random.random()))
     return (False, last_detail)
 
 
-async def _okx_check_with_fallback(session: aiohttp.ClientSession, primary_rest: str) -> tuple[bool, str]:
-    primary_url = f"{primary_rest.rstrip('/')}/api/v5/public/time"
+async def _okx_check_with_fallback(session: aiohttp.ClientSession, primary_url: str) -> tuple[bool, str]:
     ok, detail = await _check_with_retries(session, primary_url, retries=2)
     if ok:
         return (True, "reachable")
-    if detail.lower() != "timeouterror":
+    # aiohttp reports connect/read timeouts as ConnectionTimeoutError/SocketTimeoutError.
+    if not detail.lower().endswith("timeouterror"):
         return (False, detail)
 
-    fallback_url = "https://my.okx.com/api/v5/public/time"
-    fallback_ok, fallback_detail = await _check_with_retries(session, fallback_url, retries=2)
+    fallback_ok, fallback_detail = await _check_with_retries(session, _OKX_FALLBACK_TIME_URL, retries=2)
     if fallback_ok:
         return (True, "reachable_fallback")
     return (False, f"primary_timeout+fallback_{fallback_detail}")
 
 
+async def _whale_alert_check(
+    session: aiohttp.ClientSession,
+    status_url: str,
+    *,
+    enabled: bool,
+    api_key: str | None,
+) -> tuple[bool, str]:
+    if not enabled:
+        return (True, "disabled")
+    if not api_key:
+        return (False, "missing_api_key")
+    return await _simple_get_json(session, status_url, params={"api_key": api_key})
+
+
+def _check_result(result: tuple[bool, str] | BaseException) -> tuple[bool, str]:
+    if isinstance(result, BaseException):
+        return (False, result.__class__.__name__)
+    return result
+
+
 async def run_public_api_checks(
     endpoints: ExchangeEndpoints,
     *,
     whale_alert_enabled: bool,
     whale_alert_api_key: str | None,
 ) -> dict[str, tuple[bool, str]]:
-    async with aiohttp.ClientSession() as session:
-        binance = await _check_with_retries(session, f"{endpoints.binance_rest.rstrip('/')}/fapi/v1/ping", retries=2)
-        bybit = await _check_with_retries(session, f"{endpoints.bybit_rest.rstrip('/')}/v5/market/time", retries=2)
-        okx = await _okx_check_with_fallback(session, endpoints.okx_rest.rstrip("/"))
-
-        whale_alert: tuple[bool, str]
-        if not whale_alert_enabled:
-            whale_alert = (True, "disabled")
-        elif not whale_alert_api_key:
-            whale_alert = (False, "missing_api_key")
-        else:
-            whale_alert = await _simple_get_json(
-                session,
-                f"{endpoints.whale_alert_rest.rstrip('/')}/status",
-                params={"api_key": whale_alert_api_key},
-            )
+    session = _get_session()
+    # Probes are independent; run them concurrently so latency is the slowest check, not the sum.
+    results = await asyncio.gather(
+        _check_with_retries(session, endpoints.binance_ping_url, retries=2),
+        _check_with_retries(session, endpoints.bybit_time_url, retries=2),
+        _okx_check_with_fallback(session, endpoints.okx_time_url),
+        _whale_alert_check(
+            session,
+            endpoints.whale_alert_status_url,
+            enabled=whale_alert_enabled,
+            api_key=whale_alert_api_key,
+        ),
+        return_exceptions=True,
+    )
+    binance, bybit, okx, whale_alert = (_check_result(result) for result in results)
 
     return {
         "BINANCE_PUBLIC": binance,
@@ -123,6 +221,52 @@ async def run_binance_auth_check(
                 pass
 
 
+async def cached_run_public_api_checks(
+    endpoints: ExchangeEndpoints,
+    *,
+    whale_alert_enabled: bool,
+    whale_alert_api_key: str | None,
+    ttl_seconds: float = 10.0,
+    force: bool = False,
+) -> dict[str, tuple[bool, str]]:
+    return await _cached_call(
+        _PUBLIC_API_CACHE,
+        (astuple(endpoints), whale_alert_enabled, whale_alert_api_key),
+        lambda: run_public_api_checks(
+            endpoints,
+            whale_alert_enabled=whale_alert_enabled,
+            whale_alert_api_key=whale_alert_api_key,
+        ),
+        ttl_seconds=ttl_seconds,
+        force=force,
+    )
+
+
+async def cached_run_binance_auth_check(
+    *,
+    enabled: bool,
+    mode: str,
+    api_key: str | None,
+    api_secret: str | None,
+    testnet: bool,
+    ttl_seconds: float = 10.0,
+    force: bool = False,
+) -> tuple[bool, str]:
+    return await _cached_call(
+        _BINANCE_AUTH_CACHE,
+        (enabled, mode, api_key, api_secret, testnet),
+        lambda: run_binance_auth_check(
+            enabled=enabled,
+            mode=mode,
+            api_key=api_key,
+            api_secret=api_secret,
+            testnet=testnet,
+        ),
+        ttl_seconds=ttl_seconds,
+        force=force,
+    )
+
+
 def format_health_report(
     *,
     symbol: str,
@@ -135,37 +279,28 @@ def format_health_report(
 ) -> str:
     ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     lines = [
-        f"PHANTOM HEALTH - {symbol}",
-        "================================",
-        f"timestamp            : {ts}",
-        f"mode                 : {mode}",
+        f"<pre>PHANTOM HEALTH - {symbol}",
+        _REPORT_RULE,
+        "timestamp            : " + ts,
+        "mode                 : " + mode,
         "",
         "ENV",
-        _status_line("TG_BOT_TOKEN", env_presence.get("TG_BOT_TOKEN", False), ""),
-        _status_line("TG_CHAT_ID", env_presence.get("TG_CHAT_ID", False), ""),
-        _status_line("BINANCE_API_KEY", env_presence.get("BINANCE_API_KEY", False), ""),
-        _status_line("BINANCE_API_SECRET", env_presence.get("BINANCE_API_SECRET", False), ""),
-        "",
-        "API",
     ]
-    for key in ("BINANCE_PUBLIC", "BYBIT_PUBLIC", "OKX_PUBLIC", "WHALE_ALERT"):
+    lines.extend(_status_line(key, env_presence.get(key, False), "") for key in _ENV_KEYS)
+    lines.append("")
+    lines.append("API")
+    for key in _API_KEYS:
         ok, detail = api_checks.get(key, (False, "not_checked"))
         lines.append(_status_line(key, ok, detail))
     lines.append(_status_line("BINANCE_AUTH", binance_auth_check[0], binance_auth_check[1]))
-    lines += [
-        "",
-        "PIPELINE",
-        f"q_layer0             : {queue_sizes.get('l0', 0)}",
-        f"q_layer1             : {queue_sizes.get('l1', 0)}",
-        f"q_layer2             : {queue_sizes.get('l2', 0)}",
-        f"q_layer3             : {queue_sizes.get('l3', 0)}",
-    ]
-
-    for layer_name in ("layer0", "layer1", "layer2", "layer3"):
+    lines.append("")
+    lines.append("PIPELINE")
+    lines.extend(label + str(queue_sizes.get(key, 0)) for key, label in _QUEUE_LABELS)
+    for layer_name, label in _LAYER_LABELS:
         counter = counters[layer_name]
         lines.append(
-            f"{layer_name:<20}: emitted={counter.emitted_events} "
+            f"{label}{counter.emitted_events} "
             f"reconnects={_safe_reconnect_total(counter)} queue_drops={counter.queue_drops}"
         )
-    lines.append("================================")
-    return "<pre>" + "\n".join(lines) + "</pre>"
+    lines.append(_REPORT_FOOTER)
+    return "\n".join(lines)
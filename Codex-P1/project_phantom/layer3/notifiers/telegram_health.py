@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import logging
+import os
 import time
+from pathlib import Path
 from typing import Any, Awaitable, Callable
 
 
 CommandHandler = Callable[[], Awaitable[str]]
 
+_LOG = logging.getLogger(__name__)
+
+# Offset paths whose write failure was already logged; the store runs after every poll batch.
+_OFFSET_STORE_WARNED: set[str] = set()
+
 
 def _update_id(update: Any) -> int | None:
     if isinstance(update, dict):
@@ -16,33 +25,78 @@ def _update_id(update: Any) -> int | None:
     return int(value) if value is not None else None
 
 
-def _extract_message(update: Any) -> tuple[str | None, str | None]:
+def _extract_message(update: Any) -> tuple[Any, str | None]:
     if isinstance(update, dict):
         message = update.get("message", {})
-        text = message.get("text")
-        chat = message.get("chat", {})
-        chat_id = chat.get("id")
-        return (str(chat_id) if chat_id is not None else None, text)
+        return (message.get("chat", {}).get("id"), message.get("text"))
 
     message = getattr(update, "message", None)
     if message is None:
         return (None, None)
     chat = getattr(message, "chat", None)
     chat_id = getattr(chat, "id", None) if chat is not None else None
-    text = getattr(message, "text", None)
-    return (str(chat_id) if chat_id is not None else None, text)
+    return (chat_id, getattr(message, "text", None))
+
+
+def _chat_key(chat_id: Any) -> int | str | None:
+    # Telegram sends numeric ids; configs and fixtures often carry them as strings.
+    if chat_id is None or type(chat_id) is int:
+        return chat_id
+    try:
+        return int(chat_id)
+    except (TypeError, ValueError):
+        return str(chat_id)
 
 
 def _extract_command(text: str | None) -> str | None:
     if not text:
         return None
-    normalized = text.strip().lower()
-    if not normalized.startswith("/"):
+    # Reject plain chatter before doing any copying or case folding.
+    stripped = text.lstrip()
+    if not stripped.startswith("/"):
+        return None
+    # Group chats address commands as /health@BotName; the suffix is not part of the command.
+    return stripped.split(maxsplit=1)[0].partition("@")[0].lower()
+
+
+def _load_update_offset(path: str | None) -> int | None:
+    if not path:
+        return None
+    try:
+        return int(Path(path).expanduser().read_text().strip())
+    except (OSError, ValueError):
         return None
-    return normalized.split()[0]
+
+
+def _store_update_offset(path: str | None, update_id: int) -> None:
+    if not path:
+        return
+    target = Path(path).expanduser()
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(str(update_id))
+        os.replace(tmp, target)
+    except OSError as exc:
+        if path not in _OFFSET_STORE_WARNED:
+            _OFFSET_STORE_WARNED.add(path)
+            _LOG.warning("cannot persist Telegram update offset to %s (%r); restarts may replay updates", target, exc)
 
 
 class TelegramHealthService:
+    __slots__ = (
+        "_bot",
+        "_allowed_chat_id",
+        "_command_handlers",
+        "_poll_interval_seconds",
+        "_cooldown_seconds",
+        "_long_poll_timeout_seconds",
+        "_offset_path",
+        "_last_update_id",
+        "_last_command_ts",
+        "_handler_tasks",
+    )
+
     def __init__(
         self,
         *,
@@ -51,53 +105,171 @@ class TelegramHealthService:
         command_handlers: dict[str, CommandHandler],
         poll_interval_seconds: float = 2.0,
         cooldown_seconds: float = 20.0,
+        long_poll_timeout_seconds: int = 30,
+        offset_path: str | None = None,
     ) -> None:
         self._bot = bot
-        self._allowed_chat_id = str(allowed_chat_id)
+        self._allowed_chat_id = _chat_key(allowed_chat_id)
         self._command_handlers = command_handlers
         self._poll_interval_seconds = poll_interval_seconds
         self._cooldown_seconds = cooldown_seconds
-        self._last_update_id: int | None = None
+        self._long_poll_timeout_seconds = long_poll_timeout_seconds
+        self._offset_path = offset_path
+        self._last_update_id: int | None = _load_update_offset(offset_path)
         self._last_command_ts: dict[str, float] = {}
+        self._handler_tasks: set[asyncio.Task[None]] = set()
+
+    async def _poll_updates(self, stop_event: asyncio.Event) -> list[Any] | None:
+        # Telegram holds a long-poll open until an update arrives, so race it against shutdown.
+        poll = asyncio.ensure_future(
+            self._bot.get_updates(
+                offset=(self._last_update_id + 1) if self._last_update_id is not None else None,
+                timeout=self._long_poll_timeout_seconds,
+                allowed_updates=["message"],
+            )
+        )
+        stop_wait = asyncio.ensure_future(stop_event.wait())
+        try:
+            await asyncio.wait({poll, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_wait.cancel()
+        if not poll.done():
+            poll.cancel()
+            await asyncio.gather(poll, return_exceptions=True)
+            return None
+        return poll.result()
 
     async def run(self, stop_event: asyncio.Event) -> None:
+        try:
+            await self._poll_loop(stop_event)
+        finally:
+            await self._cancel_handlers()
+
+    async def _poll_loop(self, stop_event: asyncio.Event) -> None:
         while not stop_event.is_set():
+            started = time.monotonic()
+            updates: list[Any] | None = []
             try:
-                updates = await self._bot.get_updates(
-                    offset=(self._last_update_id + 1) if self._last_update_id is not None else None,
-                    timeout=max(1, int(self._poll_interval_seconds)),
-                    allowed_updates=["message"],
-                )
+                updates = await self._poll_updates(stop_event)
+                if updates is None:
+                    return
                 for update in updates:
-                    await self._handle_update(update)
+                    # Handlers run as tasks so a slow /health never holds up the next getUpdates.
+                    self._dispatch(update)
                     seen_id = _update_id(update)
                     if seen_id is not None:
                         self._last_update_id = seen_id
+                if updates and self._last_update_id is not None:
+                    _store_update_offset(self._offset_path, self._last_update_id)
             except Exception:
                 # Keep listener alive even if Telegram API has transient failures.
-                pass
+                updates = []
 
+            if updates:
+                continue
+            # The long-poll itself is the wait; only pause when a poll failed or came back early.
+            remaining = self._poll_interval_seconds - (time.monotonic() - started)
+            if remaining <= 0:
+                continue
             try:
-                await asyncio.wait_for(stop_event.wait(), timeout=self._poll_interval_seconds)
+                await asyncio.wait_for(stop_event.wait(), timeout=remaining)
             except asyncio.TimeoutError:
                 continue
 
+    async def run_webhook(
+        self,
+        stop_event: asyncio.Event,
+        *,
+        public_url: str,
+        secret_token: str,
+        host: str = "127.0.0.1",
+        port: int = 8443,
+    ) -> None:
+        """
+        Receive updates pushed by Telegram instead of polling getUpdates.
+        """
+        from aiohttp import web
+
+        path = f"/telegram/{secret_token}"
+
+        async def _on_update(request: web.Request) -> web.Response:
+            if request.headers.get("X-Telegram-Bot-Api-Secret-Token") != secret_token:
+                return web.Response(status=403)
+            try:
+                update = await request.json()
+            except ValueError:
+                return web.Response(status=400)
+            # Ack immediately; handlers (e.g. /health) can take seconds and Telegram retries slow webhooks.
+            self._dispatch(update)
+            return web.Response()
+
+        app = web.Application()
+        app.router.add_post(path, _on_update)
+        runner = web.AppRunner(app)
+        try:
+            await runner.setup()
+            await web.TCPSite(runner, host=host, port=port).start()
+            await self._bot.set_webhook(
+                url=f"{public_url.rstrip('/')}{path}",
+                secret_token=secret_token,
+                allowed_updates=["message"],
+            )
+        except Exception as exc:
+            # A busy port or rejected setWebhook must not take the trading pipeline down; poll instead.
+            _LOG.warning("webhook startup failed (%r); falling back to getUpdates polling", exc)
+            with contextlib.suppress(Exception):
+                await self._bot.delete_webhook()
+            with contextlib.suppress(Exception):
+                await runner.cleanup()
+            await self.run(stop_event)
+            return
+
+        try:
+            await stop_event.wait()
+        finally:
+            with contextlib.suppress(Exception):
+                await self._bot.delete_webhook()
+            await self._cancel_handlers()
+            await runner.cleanup()
+
+    def _dispatch(self, update: Any) -> None:
+        if _extract_command(_extract_message(update)[1]) not in self._command_handlers:
+            # Plain chatter is dropped without scheduling any work.
+            return
+        task = asyncio.create_task(self._handle_update_safely(update))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _cancel_handlers(self) -> None:
+        for task in list(self._handler_tasks):
+            task.cancel()
+        await asyncio.gather(*self._handler_tasks, return_exceptions=True)
+
+    async def _handle_update_safely(self, update: Any) -> None:
+        try:
+            await self._handle_update(update)
+        except Exception:
+            pass
+
     async def _handle_update(self, update: Any) -> None:
         chat_id, text = _extract_message(update)
         command = _extract_command(text)
-        if command not in self._command_handlers:
+        if _chat_key(chat_id) != self._allowed_chat_id:
+            # Only answer real command attempts so spam from other chats is not echoed back.
+            if command in self._command_handlers:
+                await self._bot.send_message(
+                    chat_id=chat_id,
+                    text=f"<pre>Unauthorized {command} request</pre>",
+                    parse_mode="HTML",
+                )
             return
-        if chat_id != self._allowed_chat_id:
-            await self._bot.send_message(
-                chat_id=chat_id,
-                text=f"<pre>Unauthorized {command} request</pre>",
-                parse_mode="HTML",
-            )
+        if command not in self._command_handlers:
             return
 
-        now = time.time()
-        last_run = self._last_command_ts.get(command, 0.0)
-        remaining = self._cooldown_seconds - (now - last_run)
+        now = time.monotonic()
+        last_run = self._last_command_ts.get(command)
+        # Monotonic time has an arbitrary origin, so a missing entry must not default to 0.0.
+        remaining = 0.0 if last_run is None else self._cooldown_seconds - (now - last_run)
         if remaining > 0:
             await self._bot.send_message(
                 chat_id=chat_id,
@@ -107,7 +279,16 @@ class TelegramHealthService:
             return
 
         self._last_command_ts[command] = now
+        ack: asyncio.Task[Any] | None = None
         if command == "/health":
-            await self._bot.send_message(chat_id=chat_id, text="<pre>Running PHANTOM health checks...</pre>", parse_mode="HTML")
-        report = await self._command_handlers[command]()
+            # Send the ack while the checks run so its round-trip overlaps the probes.
+            ack = asyncio.create_task(
+                self._bot.send_message(chat_id=chat_id, text="<pre>Running PHANTOM health checks...</pre>", parse_mode="HTML")
+            )
+        try:
+            report = await self._command_handlers[command]()
+        finally:
+            if ack is not None:
+                # Wait for the ack so it never lands after the report.
+                await asyncio.gather(ack, return_exceptions=True)
         await self._bot.send_message(chat_id=chat_id, text=report, parse_mode="HTML", disable_web_page_preview=True)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import Any
 
 from project_phantom.config import Layer3RiskConfig, Layer3SizingConfig
 from project_phantom.core.types import Direction, ExecutionPlan, PrePumpEvent
 
+__all__ = ["build_execution_plan", "derive_adaptive_quantity", "derive_entry_price"]
+
 
 def _to_float(value: Any) -> float | None:
     try:
@@ -15,33 +19,54 @@ def _to_float(value: Any) -> float | None:
         return None
 
 
-def _nested_float(mapping: dict[str, Any], *keys: str) -> float | None:
-    current: Any = mapping
-    for key in keys:
-        if not isinstance(current, dict):
-            return None
-        current = current.get(key)
-    return _to_float(current)
+@dataclass(slots=True)
+class _ExtractedRaw:
+    zone_low: float | None
+    zone_high: float | None
+    ob_above: float | None
+    ob_below: float | None
+    trap_score: float | None
+    regime_long_score: float | None
+    regime_short_score: float | None
+
+
+def _first_present(*values: float | None) -> float | None:
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
+def _extract_raw(event: PrePumpEvent) -> _ExtractedRaw:
+    raw = event.raw
+    absorption = event.source_absorption_raw
+    src = event.source_trap_raw
+    return _ExtractedRaw(
+        zone_low=_first_present(
+            _to_float(raw.get("swept_liquidation_zone_low")), _to_float(src.get("swept_liquidation_zone_low"))
+        ),
+        zone_high=_first_present(
+            _to_float(raw.get("swept_liquidation_zone_high")), _to_float(src.get("swept_liquidation_zone_high"))
+        ),
+        ob_above=_first_present(_to_float(raw.get("nearest_ob_above")), _to_float(src.get("nearest_ob_above"))),
+        ob_below=_first_present(_to_float(raw.get("nearest_ob_below")), _to_float(src.get("nearest_ob_below"))),
+        trap_score=_to_float(absorption.get("source_trap_score")),
+        regime_long_score=_to_float(src.get("regime_long_score")),
+        regime_short_score=_to_float(src.get("regime_short_score")),
+    )
 
 
-def _source_raw(event: PrePumpEvent) -> dict[str, Any]:
-    source_absorption_raw = event.raw.get("source_absorption_raw")
-    if not isinstance(source_absorption_raw, dict):
-        return {}
-    source_trap_raw = source_absorption_raw.get("source_trap_raw")
-    if isinstance(source_trap_raw, dict):
-        return source_trap_raw
-    return {}
+def _entry_candidates(event: PrePumpEvent) -> Iterator[float | None]:
+    raw = event.raw
+    yield _to_float(raw.get("entry"))
+    yield _to_float(raw.get("current_price"))
+    yield _to_float(event.source_absorption_raw.get("current_price"))
+    yield _to_float(event.source_trap_raw.get("current_price"))
 
 
 def derive_entry_price(event: PrePumpEvent) -> float | None:
-    src = _source_raw(event)
-    for candidate in (
-        _nested_float(event.raw, "entry"),
-        _nested_float(event.raw, "current_price"),
-        _nested_float(event.raw, "source_absorption_raw", "current_price"),
-        _nested_float(src, "current_price"),
-    ):
+    # Only the entry sources are read; the zone/OB/score fields are left for _extract_raw.
+    for candidate in _entry_candidates(event):
         if candidate is not None and candidate > 0:
             return candidate
     return None
@@ -55,21 +80,11 @@ def build_execution_plan(
     risk_config: Layer3RiskConfig,
 ) -> ExecutionPlan:
     direction: Direction = event.direction
-    src = _source_raw(event)
-
-    zone_low = _nested_float(event.raw, "swept_liquidation_zone_low")
-    zone_high = _nested_float(event.raw, "swept_liquidation_zone_high")
-    if zone_low is None:
-        zone_low = _nested_float(src, "swept_liquidation_zone_low")
-    if zone_high is None:
-        zone_high = _nested_float(src, "swept_liquidation_zone_high")
-
-    ob_above = _nested_float(event.raw, "nearest_ob_above")
-    ob_below = _nested_float(event.raw, "nearest_ob_below")
-    if ob_above is None:
-        ob_above = _nested_float(src, "nearest_ob_above")
-    if ob_below is None:
-        ob_below = _nested_float(src, "nearest_ob_below")
+    extracted = _extract_raw(event)
+    zone_low = extracted.zone_low
+    zone_high = extracted.zone_high
+    ob_above = extracted.ob_above
+    ob_below = extracted.ob_below
 
     if direction == "LONG":
         sl = zone_low if zone_low is not None and zone_low < entry_price else entry_price * (1 - risk_config.default_sl_buffer_pct)
@@ -122,28 +137,29 @@ def derive_adaptive_quantity(
     if not sizing.enabled:
         return (base_quantity, 0.0)
 
-    confirmations = max(0, int(event.components.confirmations))
-    confirmations_score = min(confirmations / 5.0, 1.0)
-    signal_score = max(0.0, min(float(event.score), 1.0))
-    trap_score = _nested_float(event.raw, "source_absorption_raw", "source_trap_score")
-    if trap_score is None:
-        trap_score = signal_score
-    trap_score = max(0.0, min(float(trap_score), 1.0))
-
-    regime_key = "regime_long_score" if event.direction == "LONG" else "regime_short_score"
-    regime_score = _nested_float(event.raw, "source_absorption_raw", "source_trap_raw", regime_key)
-    if regime_score is None:
-        regime_score = 0.5
-    regime_score = max(0.0, min(float(regime_score), 1.0))
-
-    confidence = (0.35 * signal_score) + (0.30 * confirmations_score) + (0.20 * trap_score) + (0.15 * regime_score)
-    floor = max(0.0, min(0.95, sizing.confidence_floor))
+    # Chained ternaries clamp to [0, 1] (NaN falls to 0.0) without min/max call overhead.
+    confirmations = int(event.components.confirmations)
+    confirmations_score = 0.0 if confirmations <= 0 else (1.0 if confirmations >= 5 else confirmations / 5.0)
+    raw_score = float(event.score)
+    signal_score = raw_score if 0.0 <= raw_score <= 1.0 else (1.0 if raw_score > 1.0 else 0.0)
+    extracted = _extract_raw(event)
+    t = extracted.trap_score
+    trap_score = signal_score if t is None else (t if 0.0 <= t <= 1.0 else (1.0 if t > 1.0 else 0.0))
+    r = extracted.regime_long_score if event.direction == "LONG" else extracted.regime_short_score
+    regime_score = 0.5 if r is None else (r if 0.0 <= r <= 1.0 else (1.0 if r > 1.0 else 0.0))
+
+    confidence = 0.35 * signal_score + 0.30 * confirmations_score + 0.20 * trap_score + 0.15 * regime_score
+    f = sizing.confidence_floor
+    floor = f if 0.0 <= f <= 0.95 else (0.0 if f < 0.0 else 0.95)
     if confidence <= floor:
         normalized = 0.0
     else:
-        normalized = min((confidence - floor) / max(1e-9, 1.0 - floor), 1.0)
+        normalized = (confidence - floor) / (1.0 - floor)
+        if normalized > 1.0:
+            normalized = 1.0
 
-    multiplier = sizing.min_multiplier + (sizing.max_multiplier - sizing.min_multiplier) * normalized
+    min_multiplier = sizing.min_multiplier
+    multiplier = min_multiplier + (sizing.max_multiplier - min_multiplier) * normalized
     if event.degraded:
         multiplier *= 0.7
     quantity = max(base_quantity * multiplier, base_quantity * 0.1)
@@ -14,45 +14,49 @@ def _to_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
-def _pct(value: float) -> str:
-    return f"{value * 100:+.2f}%"
+_SIGNAL_TEMPLATE = (
+    "<pre>"
+    "🎯 PHANTOM SIGNAL - %(symbol)s\n"
+    "================================\n"
+    "TRAP DETECTED -> %(direction_title)s\n\n"
+    "Liquidation Swept : $%(liq_swept)s %(liq_flag)s\n"
+    "Funding Rate      : %(funding_pct)+.4f%% -> %(funding_state)s %(funding_flag)s\n"
+    "Cross-Exchange OI : %(oi_note_text)s %(oi_flag)s\n"
+    "CHoCH 5m          : %(choch_flag)s\n"
+    "CVD Divergence    : %(cvd_flag)s\n"
+    "OB Imbalance      : %(obi_flag)s\n"
+    "Sweep Aggression  : %(sweep_flag)s\n\n"
+    "SCORE: %(score_100)d/100\n\n"
+    "Entry : $%(entry)s\n"
+    "SL    : $%(sl)s (%(sl_pct)+.2f%%)\n"
+    "TP1   : $%(tp1)s (%(tp1_pct)+.2f%%)\n"
+    "TP2   : $%(tp2)s (%(tp2_pct)+.2f%%)\n"
+    "R:R   : 1:%(rr).2f"
+    "\nQty   : %(quantity).6f"
+    "%(ids_line)s"
+    "================================"
+    "</pre>"
+)
 
 
 def _check(flag: bool) -> str:
     return "✅" if flag else "❌"
 
 
-def _extract_source_trap_raw(event: PrePumpEvent) -> dict[str, Any]:
-    source_absorption_raw = event.raw.get("source_absorption_raw")
-    if not isinstance(source_absorption_raw, dict):
-        return {}
-    source_trap_raw = source_absorption_raw.get("source_trap_raw")
-    if not isinstance(source_trap_raw, dict):
-        return {}
-    return source_trap_raw
-
-
-def _extract_absorption_components(event: PrePumpEvent) -> dict[str, Any]:
-    data = event.raw.get("source_absorption_components")
-    if isinstance(data, dict):
-        return data
-    return {}
-
-
 def format_telegram_signal(
     event: PrePumpEvent,
     plan: ExecutionPlan,
     *,
     order_ids: dict[str, str] | None = None,
 ) -> str:
-    trap_raw = _extract_source_trap_raw(event)
-    absorption_components = _extract_absorption_components(event)
+    trap_raw = event.source_trap_raw
+    absorption_components = event.absorption_components
 
     liq_swept = _to_float(trap_raw.get("short_cluster_p90_notional") or trap_raw.get("long_cluster_p90_notional"))
     funding_rate = _to_float(trap_raw.get("avg_funding"))
     oi_note = trap_raw.get("oi_spread_pct")
     oi_spread = _to_float(oi_note)
-    oi_note_text = f"{oi_spread:.2f}%" if oi_note is not None else "n/a"
+    oi_note_text = "%.2f%%" % oi_spread if oi_note is not None else "n/a"
     choch_flag = _check(bool(event.components.choch))
 
     cvd_long = _to_float(absorption_components.get("cvd_long"))
@@ -94,26 +98,30 @@ def format_telegram_signal(
         tp2_id = order_ids.get("tp2", "n/a")
         ids_line = f"\nORDERS: E#{entry_id} SL#{sl_id} TP1#{tp1_id} TP2#{tp2_id}\n"
 
-    return (
-        "<pre>"
-        f"🎯 PHANTOM SIGNAL - {event.symbol}\n"
-        "================================\n"
-        f"TRAP DETECTED -> {direction_title}\n\n"
-        f"Liquidation Swept : ${liq_swept:,.0f} {liq_flag}\n"
-        f"Funding Rate      : {funding_rate:+.4%} -> {funding_state} {funding_flag}\n"
-        f"Cross-Exchange OI : {oi_note_text} {oi_flag}\n"
-        f"CHoCH 5m          : {choch_flag}\n"
-        f"CVD Divergence    : {cvd_flag}\n"
-        f"OB Imbalance      : {obi_flag}\n"
-        f"Sweep Aggression  : {sweep_flag}\n\n"
-        f"SCORE: {score_100}/100\n\n"
-        f"Entry : ${plan.entry:,.2f}\n"
-        f"SL    : ${plan.sl:,.2f} ({_pct(plan.sl_pct)})\n"
-        f"TP1   : ${plan.tp1:,.2f} ({_pct(plan.tp1_pct)})\n"
-        f"TP2   : ${plan.tp2:,.2f} ({_pct(plan.tp2_pct)})\n"
-        f"R:R   : 1:{plan.rr:.2f}"
-        f"\nQty   : {plan.quantity:.6f}"
-        f"{ids_line}"
-        "================================"
-        "</pre>"
-    )
+    # %-style fields cannot do thousands grouping, so the $ amounts are pre-formatted.
+    return _SIGNAL_TEMPLATE % {
+        "symbol": event.symbol,
+        "direction_title": direction_title,
+        "liq_swept": format(liq_swept, ",.0f"),
+        "liq_flag": liq_flag,
+        "funding_pct": funding_rate * 100,
+        "funding_state": funding_state,
+        "funding_flag": funding_flag,
+        "oi_note_text": oi_note_text,
+        "oi_flag": oi_flag,
+        "choch_flag": choch_flag,
+        "cvd_flag": cvd_flag,
+        "obi_flag": obi_flag,
+        "sweep_flag": sweep_flag,
+        "score_100": score_100,
+        "entry": format(plan.entry, ",.2f"),
+        "sl": format(plan.sl, ",.2f"),
+        "sl_pct": plan.sl_pct * 100,
+        "tp1": format(plan.tp1, ",.2f"),
+        "tp1_pct": plan.tp1_pct * 100,
+        "tp2": format(plan.tp2, ",.2f"),
+        "tp2_pct": plan.tp2_pct * 100,
+        "rr": plan.rr,
+        "quantity": plan.quantity,
+        "ids_line": ids_line,
+    }
@@ -3,32 +3,113 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import copy
+import heapq
+import json
+import logging
+import os
+import random
+import secrets
+import sys
 import time
-from dataclasses import dataclass
-
-from project_phantom.config import Layer0Config, Layer1Config, Layer2Config, Layer3Config
+from array import array
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from functools import lru_cache, partial
+from logging.handlers import QueueHandler, QueueListener
+from operator import attrgetter
+from pathlib import Path
+from queue import SimpleQueue
+from typing import Any, TypeVar
+
+from project_phantom.config import ExchangeEndpoints, Layer0Config, Layer1Config, Layer2Config, Layer3Config
+from project_phantom.core.ringq import RingQueue
 from project_phantom.core.types import AbsorptionEvent, ExecutionEvent, HealthCounters, PrePumpEvent, TrapSetupEvent
 from project_phantom.layer0.trap_detector import run_layer0
 from project_phantom.layer1.absorption_engine import run_layer1
 from project_phantom.layer2.ignition_engine import run_layer2
 from project_phantom.layer3.executor import run_layer3
-from project_phantom.layer3.health_report import format_health_report, run_binance_auth_check, run_public_api_checks
-from project_phantom.universe import discover_common_futures_symbols
+from project_phantom.layer3.health_report import (
+    cached_run_binance_auth_check,
+    cached_run_public_api_checks,
+    close_health_session,
+    format_health_report,
+)
+from project_phantom.universe import close_discovery_session, discover_common_futures_symbols
 
 DEFAULT_ALL_COMMON_MAX_SYMBOLS = 20
 DEFAULT_HARD_CAP_SYMBOLS = 25
+DEFAULT_SYMBOLS_CACHE_PATH = "~/.cache/phantom/common_symbols.json"
+SYMBOLS_CACHE_TTL_SECONDS = 6 * 3600
+EXECUTION_PRINT_BATCH = 256
+AGGREGATE_CACHE_TTL_SECONDS = 1.0
+
+
+_ConfigT = TypeVar("_ConfigT")
+
+_OUTPUT_LOG = logging.getLogger("phantom.output")
+_OUTPUT_LOG.setLevel(logging.INFO)
+_OUTPUT_LOG.propagate = False
 
+_REPORT_RULE = "================================"
+_REPORT_FOOTER = _REPORT_RULE + "</pre>"
+_QUEUE_PREFIXES = tuple((key, f"q_layer{key[1]}".ljust(21) + ": ") for key in ("l0", "l1", "l2", "l3"))
+_LAYER_PREFIXES = tuple(
+    (name, name.ljust(20) + ": emitted=", f"{name}_last_signal    : ") for name in ("layer0", "layer1", "layer2", "layer3")
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class _SymbolRuntime:
     symbol: str
-    queue_l0: asyncio.Queue[TrapSetupEvent]
-    queue_l1: asyncio.Queue[AbsorptionEvent]
-    queue_l2: asyncio.Queue[PrePumpEvent]
+    queue_l0: RingQueue[TrapSetupEvent]
+    queue_l1: RingQueue[AbsorptionEvent]
+    queue_l2: RingQueue[PrePumpEvent]
     health_l0: HealthCounters
     health_l1: HealthCounters
     health_l2: HealthCounters
     health_l3: HealthCounters
+    stats_label: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.stats_label = f"{self.symbol:<12} : "
+
+    @property
+    def health(self) -> tuple[HealthCounters, HealthCounters, HealthCounters, HealthCounters]:
+        return (self.health_l0, self.health_l1, self.health_l2, self.health_l3)
+
+
+@dataclass(slots=True)
+class _PipelineCounters:
+    """
+    Per-symbol runtimes plus a short-lived cache of their summed health counters.
+    """
+
+    runtimes: list[_SymbolRuntime]
+    ts: float = 0.0
+    totals: dict[str, HealthCounters] | None = None
+
+    def get(self) -> dict[str, HealthCounters]:
+        # Heartbeat and Telegram commands tend to land together; share one walk over all runtimes.
+        now = time.monotonic()
+        if self.totals is not None and now - self.ts < AGGREGATE_CACHE_TTL_SECONDS:
+            return self.totals
+
+        totals = (HealthCounters(), HealthCounters(), HealthCounters(), HealthCounters())
+        for runtime in self.runtimes:
+            for target, counter in zip(totals, runtime.health):
+                target.stale_cycles += counter.stale_cycles
+                target.queue_drops += counter.queue_drops
+                target.emitted_events += counter.emitted_events
+                if counter.last_emitted_ts_ms is not None:
+                    if target.last_emitted_ts_ms is None or counter.last_emitted_ts_ms > target.last_emitted_ts_ms:
+                        target.last_emitted_ts_ms = counter.last_emitted_ts_ms
+                for exchange, count in counter.reconnects.items():
+                    target.reconnects[exchange] = target.reconnects.get(exchange, 0) + count
+
+        self.ts = now
+        self.totals = dict(zip(("layer0", "layer1", "layer2", "layer3"), totals))
+        return self.totals
 
 
 def _normalize_symbol(symbol: str) -> str:
@@ -36,17 +117,7 @@ def _normalize_symbol(symbol: str) -> str:
 
 
 def _parse_symbol_csv(raw: str) -> list[str]:
-    seen: set[str] = set()
-    symbols: list[str] = []
-    for part in raw.split(","):
-        symbol = _normalize_symbol(part)
-        if not symbol:
-            continue
-        if symbol in seen:
-            continue
-        seen.add(symbol)
-        symbols.append(symbol)
-    return symbols
+    return list(dict.fromkeys(symbol for symbol in map(_normalize_symbol, raw.split(",")) if symbol))
 
 
 def _symbol_scope(symbols: list[str]) -> str:
@@ -55,20 +126,58 @@ def _symbol_scope(symbols: list[str]) -> str:
     return f"MULTI[{len(symbols)}]"
 
 
+def _load_cached_symbols(path: str | None) -> list[str] | None:
+    if not path:
+        return None
+    target = Path(path).expanduser()
+    try:
+        if time.time() - target.stat().st_mtime > SYMBOLS_CACHE_TTL_SECONDS:
+            return None
+        symbols = json.loads(target.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(symbols, list) or not all(isinstance(item, str) for item in symbols):
+        return None
+    return symbols or None
+
+
+def _store_cached_symbols(path: str | None, symbols: list[str]) -> None:
+    if not path:
+        return
+    target = Path(path).expanduser()
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        tmp.write_text(json.dumps(symbols))
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=1)
+def _default_endpoints() -> ExchangeEndpoints:
+    # Layer configs take their endpoints from plain ExchangeEndpoints defaults; no env-backed config needed.
+    return ExchangeEndpoints()
+
+
 async def _resolve_symbols(args: argparse.Namespace) -> list[str]:
     if args.symbols is None or not args.symbols.strip():
         return [_normalize_symbol(args.symbol)]
 
     if args.symbols.strip().upper() == "ALL_COMMON":
-        endpoints = Layer0Config().endpoints
         requested_max_symbols = args.max_symbols if args.max_symbols > 0 else DEFAULT_ALL_COMMON_MAX_SYMBOLS
-        discovered = await discover_common_futures_symbols(
-            endpoints=endpoints,
-            max_symbols=requested_max_symbols,
-        )
+        # Cache the full volume-ranked list so a different --max-symbols can reuse it.
+        discovered = _load_cached_symbols(args.symbols_cache)
+        if discovered is None:
+            try:
+                discovered = await discover_common_futures_symbols(endpoints=_default_endpoints())
+            finally:
+                await close_discovery_session()
+            if discovered:
+                _store_cached_symbols(args.symbols_cache, discovered)
         if not discovered:
             raise RuntimeError("No futures symbols were discovered from Binance/Bybit endpoints")
-        return discovered
+        return discovered[:requested_max_symbols]
 
     symbols = _parse_symbol_csv(args.symbols)
     if not symbols:
@@ -76,6 +185,15 @@ async def _resolve_symbols(args: argparse.Namespace) -> list[str]:
     return symbols
 
 
+def _symbol_config(base: _ConfigT, **changes: Any) -> _ConfigT:
+    # Deep-copy so no two symbols share a mutable nested sub-config (thresholds, risk, telegram, ...).
+    return replace(copy.deepcopy(base), **changes)  # type: ignore[type-var]
+
+
+def _ranked_queue_maxsize(rank: int, base: int) -> int:
+    return max(20, min(400, base * 8 // (rank + 1)))
+
+
 def _apply_fanout_cap(symbols: list[str], *, hard_cap_symbols: int, allow_unsafe_fanout: bool) -> list[str]:
     if allow_unsafe_fanout:
         return symbols
@@ -84,73 +202,106 @@ def _apply_fanout_cap(symbols: list[str], *, hard_cap_symbols: int, allow_unsafe
     if len(symbols) <= hard_cap_symbols:
         return symbols
     trimmed = symbols[:hard_cap_symbols]
-    print(
+    _emit(
         f"[SAFE-CAP] Requested {len(symbols)} symbols; using first {hard_cap_symbols} to avoid OOM. "
-        "Use --allow-unsafe-fanout to override.",
-        flush=True,
+        "Use --allow-unsafe-fanout to override.\n"
     )
     return trimmed
 
 
-def _aggregate_queue_sizes(
-    runtimes: list[_SymbolRuntime],
-    execution_queue: asyncio.Queue[ExecutionEvent],
-) -> dict[str, int]:
-    return {
-        "l0": sum(runtime.queue_l0.qsize() for runtime in runtimes),
-        "l1": sum(runtime.queue_l1.qsize() for runtime in runtimes),
-        "l2": sum(runtime.queue_l2.qsize() for runtime in runtimes),
+def _get_snapshot(
+    pipeline: _PipelineCounters,
+    execution_queue: RingQueue[ExecutionEvent],
+    layer_depths: array[int],
+) -> tuple[dict[str, int], dict[str, HealthCounters]]:
+    # Depths are O(1) reads and always live; only the per-runtime counter walk is cached.
+    queue_sizes = {
+        "l0": layer_depths[0],
+        "l1": layer_depths[1],
+        "l2": layer_depths[2],
         "l3": execution_queue.qsize(),
     }
+    return (queue_sizes, pipeline.get())
 
 
-def _aggregate_counters(runtimes: list[_SymbolRuntime]) -> dict[str, HealthCounters]:
-    aggregate = {
-        "layer0": HealthCounters(),
-        "layer1": HealthCounters(),
-        "layer2": HealthCounters(),
-        "layer3": HealthCounters(),
-    }
+_EXECUTION_LINE = "[EXECUTION] symbol=%s direction=%s entry=%r sl=%r tp1=%r tp2=%r rr=1:%r mode=%s\n"
+
+
+def _format_execution_line(event: ExecutionEvent) -> str:
+    plan = event.plan
+    return _EXECUTION_LINE % (
+        event.symbol,
+        event.direction,
+        plan.entry,
+        plan.sl,
+        plan.tp1,
+        plan.tp2,
+        plan.rr,
+        event.raw.get("execution_mode"),
+    )
+
+
+def _drain_execution_lines(queue: RingQueue[ExecutionEvent], lines: list[str], limit: int) -> None:
+    # Bounded by qsize() so a drain never ends in a raised QueueEmpty.
+    for _ in range(min(limit - len(lines), queue.qsize())):
+        lines.append(_format_execution_line(queue.get_nowait()))
+
+
+def _start_output_listener() -> QueueListener:
+    # All stdout output (boot, heartbeat, executions) goes through one writer thread so a slow pipe never stalls the loop.
+    output_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.terminator = ""
+    listener = QueueListener(output_queue, handler)
+    _OUTPUT_LOG.addHandler(QueueHandler(output_queue))
+    listener.start()
+    return listener
+
+
+def _stop_output_listener(listener: QueueListener) -> None:
+    listener.stop()
+    for handler in list(_OUTPUT_LOG.handlers):
+        _OUTPUT_LOG.removeHandler(handler)
+
+
+def _emit(text: str) -> None:
+    # Every stdout line goes through the output listener started by main().
+    _OUTPUT_LOG.info(text)
 
-    for runtime in runtimes:
-        per_layer = {
-            "layer0": runtime.health_l0,
-            "layer1": runtime.health_l1,
-            "layer2": runtime.health_l2,
-            "layer3": runtime.health_l3,
-        }
-        for layer_name, counter in per_layer.items():
-            target = aggregate[layer_name]
-            target.stale_cycles += counter.stale_cycles
-            target.queue_drops += counter.queue_drops
-            target.emitted_events += counter.emitted_events
-            if counter.last_emitted_ts_ms is not None:
-                if target.last_emitted_ts_ms is None or counter.last_emitted_ts_ms > target.last_emitted_ts_ms:
-                    target.last_emitted_ts_ms = counter.last_emitted_ts_ms
-            for exchange, count in counter.reconnects.items():
-                target.reconnects[exchange] = target.reconnects.get(exchange, 0) + count
-
-    return aggregate
-
-
-async def _execution_printer(queue: asyncio.Queue[ExecutionEvent], stop_event: asyncio.Event) -> None:
-    while not stop_event.is_set():
-        try:
-            event = await asyncio.wait_for(queue.get(), timeout=0.5)
-        except asyncio.TimeoutError:
-            continue
-        print(
-            f"[EXECUTION] symbol={event.symbol} direction={event.direction} "
-            f"entry={event.plan.entry} sl={event.plan.sl} tp1={event.plan.tp1} tp2={event.plan.tp2} "
-            f"rr=1:{event.plan.rr} mode={event.raw.get('execution_mode')}",
-            flush=True,
-        )
+
+def _write_lines(lines: list[str]) -> None:
+    if lines:
+        _emit("".join(lines))
+        lines.clear()
+
+
+async def _execution_printer(queue: RingQueue[ExecutionEvent], stop_event: asyncio.Event) -> None:
+    lines: list[str] = []
+    try:
+        # Block on the queue with no timer; main() cancels this task during shutdown.
+        while not stop_event.is_set():
+            lines.append(_format_execution_line(await queue.get()))
+            # Yield once so producers scheduled in the same tick land in this batch.
+            await asyncio.sleep(0)
+            # Drain whatever else is already queued so a burst costs one write and one flush.
+            _drain_execution_lines(queue, lines, EXECUTION_PRINT_BATCH)
+            _write_lines(lines)
+    finally:
+        # Cancellation can land mid-batch; never drop executions that were already dequeued or queued.
+        _drain_execution_lines(queue, lines, queue.qsize() + len(lines))
+        _write_lines(lines)
+
+
+@lru_cache(maxsize=128)
+def _fmt_ts_sec(sec: int) -> str:
+    return datetime.fromtimestamp(sec).isoformat(sep=" ", timespec="seconds")
 
 
 def _format_last_ts(ts_ms: int | None) -> str:
     if ts_ms is None:
         return "n/a"
-    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts_ms / 1000))
+    # Reports re-render the same last-signal timestamps, so conversions are memoized per second.
+    return _fmt_ts_sec(ts_ms // 1000)
 
 
 def _format_stats_report(
@@ -160,50 +311,37 @@ def _format_stats_report(
     counters: dict[str, HealthCounters],
     runtimes: list[_SymbolRuntime],
 ) -> str:
-    lines = [
-        f"PHANTOM STATS - {symbol_scope}",
-        "================================",
-        f"q_layer0             : {queue_sizes.get('l0', 0)}",
-        f"q_layer1             : {queue_sizes.get('l1', 0)}",
-        f"q_layer2             : {queue_sizes.get('l2', 0)}",
-        f"q_layer3             : {queue_sizes.get('l3', 0)}",
-        "",
-    ]
-    for layer_name in ("layer0", "layer1", "layer2", "layer3"):
+    lines = [f"<pre>PHANTOM STATS - {symbol_scope}", _REPORT_RULE]
+    lines.extend(prefix + str(queue_sizes.get(key, 0)) for key, prefix in _QUEUE_PREFIXES)
+    lines.append("")
+    for layer_name, prefix, last_signal_prefix in _LAYER_PREFIXES:
         counter = counters[layer_name]
         reconnects = sum(counter.reconnects.values())
-        lines.append(
-            f"{layer_name:<20}: emitted={counter.emitted_events} reconnects={reconnects} "
-            f"queue_drops={counter.queue_drops}"
-        )
-        lines.append(f"{layer_name}_last_signal    : {_format_last_ts(counter.last_emitted_ts_ms)}")
+        lines.append(f"{prefix}{counter.emitted_events} reconnects={reconnects} queue_drops={counter.queue_drops}")
+        lines.append(last_signal_prefix + _format_last_ts(counter.last_emitted_ts_ms))
 
     if len(runtimes) > 1:
         lines.append("")
         lines.append("SYMBOL EMITS (l0/l1/l2/l3)")
-        shown = 0
-        for runtime in sorted(runtimes, key=lambda item: item.symbol):
-            lines.append(
-                f"{runtime.symbol:<12} : "
-                f"{runtime.health_l0.emitted_events}/"
-                f"{runtime.health_l1.emitted_events}/"
-                f"{runtime.health_l2.emitted_events}/"
-                f"{runtime.health_l3.emitted_events}"
-            )
-            shown += 1
-            if shown >= 20:
-                break
-        if len(runtimes) > shown:
-            lines.append(f"... +{len(runtimes) - shown} more symbols")
+        # Alphabetical first 20; nsmallest avoids sorting the whole fan-out on every /stats.
+        shown = heapq.nsmallest(20, runtimes, key=attrgetter("symbol"))
+        lines.extend(
+            f"{runtime.stats_label}{runtime.health_l0.emitted_events}/{runtime.health_l1.emitted_events}/"
+            f"{runtime.health_l2.emitted_events}/{runtime.health_l3.emitted_events}"
+            for runtime in shown
+        )
+        if len(runtimes) > len(shown):
+            lines.append(f"... +{len(runtimes) - len(shown)} more symbols")
 
-    lines.append("================================")
-    return "<pre>" + "\n".join(lines) + "</pre>"
+    # The <pre> wrapper rides on the first and last lines, so the body is joined exactly once.
+    lines.append(_REPORT_FOOTER)
+    return "\n".join(lines)
 
 
 def _format_mode_report(*, symbol_scope: str, symbol_count: int, layer3: Layer3Config) -> str:
     lines = [
-        f"PHANTOM MODE - {symbol_scope}",
-        "================================",
+        f"<pre>PHANTOM MODE - {symbol_scope}",
+        _REPORT_RULE,
         f"execution_mode       : {layer3.execution_mode}",
         f"execution_enabled    : {layer3.enable_execution}",
         f"telegram_enabled     : {layer3.telegram.enabled}",
@@ -217,35 +355,113 @@ def _format_mode_report(*, symbol_scope: str, symbol_count: int, layer3: Layer3C
         f"sizing_min_max_mult  : {layer3.sizing.min_multiplier}-{layer3.sizing.max_multiplier}",
         f"session_enabled      : {layer3.session.enabled}",
         f"session_hours_utc    : {','.join(str(x) for x in layer3.session.allowed_hours_utc)}",
-        "================================",
+        _REPORT_FOOTER,
     ]
-    return "<pre>" + "\n".join(lines) + "</pre>"
+    return "\n".join(lines)
+
+
+async def _build_health_report(
+    *,
+    pipeline: _PipelineCounters,
+    execution_queue: RingQueue[ExecutionEvent],
+    layer_depths: array[int],
+    symbol_scope: str,
+    layer0: Layer0Config,
+    layer1: Layer1Config,
+    layer3: Layer3Config,
+    env_presence: dict[str, bool],
+) -> str:
+    cache_ttl = layer3.telegram.health_cache_ttl_seconds
+    api_checks = await cached_run_public_api_checks(
+        layer0.endpoints,
+        whale_alert_enabled=layer1.whale_alert.enabled,
+        whale_alert_api_key=layer1.whale_alert.api_key,
+        ttl_seconds=cache_ttl,
+    )
+    binance_auth = await cached_run_binance_auth_check(
+        enabled=layer3.enable_execution,
+        mode=layer3.execution_mode,
+        api_key=layer3.binance.api_key,
+        api_secret=layer3.binance.api_secret,
+        testnet=layer3.binance.testnet,
+        ttl_seconds=cache_ttl,
+    )
+    queue_sizes, counters = _get_snapshot(pipeline, execution_queue, layer_depths)
+    return format_health_report(
+        symbol=symbol_scope,
+        mode=layer3.execution_mode,
+        queue_sizes=queue_sizes,
+        counters=counters,
+        api_checks=api_checks,
+        binance_auth_check=binance_auth,
+        env_presence=env_presence,
+    )
+
+
+async def _build_stats_report(
+    *,
+    pipeline: _PipelineCounters,
+    execution_queue: RingQueue[ExecutionEvent],
+    layer_depths: array[int],
+    symbol_scope: str,
+) -> str:
+    queue_sizes, counters = _get_snapshot(pipeline, execution_queue, layer_depths)
+    return _format_stats_report(
+        symbol_scope=symbol_scope,
+        queue_sizes=queue_sizes,
+        counters=counters,
+        runtimes=pipeline.runtimes,
+    )
+
+
+async def _build_mode_report(report: str) -> str:
+    return report
 
 
 async def _heartbeat_logger(
     *,
     stop_event: asyncio.Event,
-    runtimes: list[_SymbolRuntime],
-    execution_queue: asyncio.Queue[ExecutionEvent],
+    pipeline: _PipelineCounters,
+    execution_queue: RingQueue[ExecutionEvent],
+    layer_depths: array[int],
     interval_seconds: int = 60,
+    min_interval_seconds: int = 15,
+    max_interval_seconds: int = 300,
+    busy_queue_depth: int = 20,
 ) -> None:
-    while not stop_event.is_set():
-        queue_sizes = _aggregate_queue_sizes(runtimes, execution_queue)
-        counters = _aggregate_counters(runtimes)
-        print(
-            "[HEARTBEAT] "
-            f"symbols={len(runtimes)} "
-            f"q=({queue_sizes['l0']},{queue_sizes['l1']},{queue_sizes['l2']},{queue_sizes['l3']}) "
-            f"emitted=({counters['layer0'].emitted_events},{counters['layer1'].emitted_events},"
-            f"{counters['layer2'].emitted_events},{counters['layer3'].emitted_events}) "
-            f"drops=({counters['layer0'].queue_drops},{counters['layer1'].queue_drops},"
-            f"{counters['layer2'].queue_drops},{counters['layer3'].queue_drops})",
-            flush=True,
-        )
-        try:
-            await asyncio.wait_for(stop_event.wait(), timeout=interval_seconds)
-        except asyncio.TimeoutError:
-            continue
+    current_interval = float(interval_seconds)
+    last_snapshot: tuple[Any, ...] | None = None
+    # One long-lived stop waiter shared by every interval; each pass only arms a plain sleep.
+    stop_task = asyncio.create_task(stop_event.wait())
+    try:
+        while not stop_event.is_set():
+            queue_sizes, counters = _get_snapshot(pipeline, execution_queue, layer_depths)
+            emitted = tuple(counters[name].emitted_events for name in ("layer0", "layer1", "layer2", "layer3"))
+            drops = tuple(counters[name].queue_drops for name in ("layer0", "layer1", "layer2", "layer3"))
+            depths = (queue_sizes["l0"], queue_sizes["l1"], queue_sizes["l2"], queue_sizes["l3"])
+            _emit(
+                "[HEARTBEAT] "
+                f"symbols={len(pipeline.runtimes)} "
+                f"q=({depths[0]},{depths[1]},{depths[2]},{depths[3]}) "
+                f"emitted=({emitted[0]},{emitted[1]},{emitted[2]},{emitted[3]}) "
+                f"drops=({drops[0]},{drops[1]},{drops[2]},{drops[3]})\n"
+            )
+
+            # Back off while the pipeline is idle, tighten up when queues are filling.
+            snapshot = (emitted, drops, depths)
+            if max(depths) >= busy_queue_depth:
+                current_interval = float(min_interval_seconds)
+            elif snapshot == last_snapshot:
+                current_interval = min(current_interval * 2, float(max_interval_seconds))
+            else:
+                current_interval = float(interval_seconds)
+            last_snapshot = snapshot
+
+            sleep_task = asyncio.create_task(asyncio.sleep(current_interval * random.uniform(0.9, 1.1)))
+            await asyncio.wait((stop_task, sleep_task), return_when=asyncio.FIRST_COMPLETED)
+            sleep_task.cancel()
+    finally:
+        stop_task.cancel()
 
 
 async def main() -> None:
@@ -273,10 +489,23 @@ async def main() -> None:
         action="store_true",
         help="Disable safety cap and allow very high symbol fanout (higher OOM risk).",
     )
+    parser.add_argument(
+        "--symbols-cache",
+        default=os.getenv("PHANTOM_SYMBOLS_CACHE", DEFAULT_SYMBOLS_CACHE_PATH),
+        help="File caching the ALL_COMMON discovery for 6h. Empty string disables.",
+    )
     parser.add_argument("--mode", choices=["paper", "live"], default="paper")
     parser.add_argument("--no-telegram", action="store_true")
     args = parser.parse_args()
 
+    output_listener = _start_output_listener()
+    try:
+        await _run_pipeline(args)
+    finally:
+        _stop_output_listener(output_listener)
+
+
+async def _run_pipeline(args: argparse.Namespace) -> None:
     symbols = await _resolve_symbols(args)
     symbols = _apply_fanout_cap(
         symbols,
@@ -286,13 +515,12 @@ async def main() -> None:
     symbol_scope = _symbol_scope(symbols)
 
     stop_event = asyncio.Event()
-    execution_queue: asyncio.Queue[ExecutionEvent] = asyncio.Queue(maxsize=max(200, len(symbols) * 12))
+    execution_queue: RingQueue[ExecutionEvent] = RingQueue(max(200, len(symbols) * 12))
 
-    print(
+    _emit(
         "[BOOT] "
         f"symbol_scope={symbol_scope} mode={args.mode} symbols_count={len(symbols)} "
-        f"symbols_sample={','.join(symbols[:8])}",
-        flush=True,
+        f"symbols_sample={','.join(symbols[:8])}\n"
     )
 
     runtimes: list[_SymbolRuntime] = []
@@ -304,22 +532,47 @@ async def main() -> None:
     else:
         per_symbol_queue_max = 40
 
-    for symbol in symbols:
-        queue_l0: asyncio.Queue[TrapSetupEvent] = asyncio.Queue(maxsize=per_symbol_queue_max)
-        queue_l1: asyncio.Queue[AbsorptionEvent] = asyncio.Queue(maxsize=per_symbol_queue_max)
-        queue_l2: asyncio.Queue[PrePumpEvent] = asyncio.Queue(maxsize=per_symbol_queue_max)
+    # Per-symbol configs only differ by symbol; build the env-derived defaults once and copy.
+    base_layer0 = Layer0Config(queue_maxsize=per_symbol_queue_max)
+    base_layer1 = Layer1Config(queue_maxsize=per_symbol_queue_max)
+    base_layer2 = Layer2Config(queue_maxsize=per_symbol_queue_max)
+    base_layer3 = Layer3Config(queue_maxsize=per_symbol_queue_max, execution_mode=args.mode)
+    if args.no_telegram:
+        base_layer3 = replace(base_layer3, telegram=replace(base_layer3.telegram, enabled=False))
+
+    # Running totals of queued items per layer across all symbols, maintained by the queues themselves.
+    layer_depths = array("q", [0, 0, 0])
+
+    # ALL_COMMON comes back ranked by 24h quote volume, so buffers can follow expected burstiness.
+    volume_ranked = args.symbols is not None and args.symbols.strip().upper() == "ALL_COMMON"
+    queue_maxsizes = [
+        _ranked_queue_maxsize(rank, per_symbol_queue_max) if volume_ranked else per_symbol_queue_max
+        for rank in range(len(symbols))
+    ]
+
+    # The first symbol's configs double as the Telegram/health configs.
+    primary_symbol = symbols[0]
+    primary_layer0 = _symbol_config(base_layer0, symbol=primary_symbol, queue_maxsize=queue_maxsizes[0])
+    primary_layer1 = _symbol_config(base_layer1, symbol=primary_symbol, queue_maxsize=queue_maxsizes[0])
+    primary_layer3 = _symbol_config(base_layer3, symbol=primary_symbol, queue_maxsize=queue_maxsizes[0])
+
+    for symbol, queue_max in zip(symbols, queue_maxsizes):
+        queue_l0: RingQueue[TrapSetupEvent] = RingQueue(queue_max, depths=layer_depths, depth_slot=0)
+        queue_l1: RingQueue[AbsorptionEvent] = RingQueue(queue_max, depths=layer_depths, depth_slot=1)
+        queue_l2: RingQueue[PrePumpEvent] = RingQueue(queue_max, depths=layer_depths, depth_slot=2)
 
         health_l0 = HealthCounters()
         health_l1 = HealthCounters()
         health_l2 = HealthCounters()
         health_l3 = HealthCounters()
 
-        layer0 = Layer0Config(symbol=symbol, queue_maxsize=per_symbol_queue_max)
-        layer1 = Layer1Config(symbol=symbol, queue_maxsize=per_symbol_queue_max)
-        layer2 = Layer2Config(symbol=symbol, queue_maxsize=per_symbol_queue_max)
-        layer3 = Layer3Config(symbol=symbol, queue_maxsize=per_symbol_queue_max, execution_mode=args.mode)
-        if args.no_telegram:
-            layer3.telegram.enabled = False
+        if symbol == primary_symbol:
+            layer0, layer1, layer3 = primary_layer0, primary_layer1, primary_layer3
+        else:
+            layer0 = _symbol_config(base_layer0, symbol=symbol, queue_maxsize=queue_max)
+            layer1 = _symbol_config(base_layer1, symbol=symbol, queue_maxsize=queue_max)
+            layer3 = _symbol_config(base_layer3, symbol=symbol, queue_maxsize=queue_max)
+        layer2 = _symbol_config(base_layer2, symbol=symbol, queue_maxsize=queue_max)
 
         runtimes.append(
             _SymbolRuntime(
@@ -362,25 +615,21 @@ async def main() -> None:
             ]
         )
 
+    pipeline = _PipelineCounters(runtimes)
+
     tasks.append(asyncio.create_task(_execution_printer(execution_queue, stop_event), name="execution-printer"))
     tasks.append(
         asyncio.create_task(
             _heartbeat_logger(
                 stop_event=stop_event,
-                runtimes=runtimes,
+                pipeline=pipeline,
                 execution_queue=execution_queue,
+                layer_depths=layer_depths,
             ),
             name="heartbeat-logger",
         )
     )
 
-    primary_symbol = symbols[0]
-    primary_layer0 = Layer0Config(symbol=primary_symbol)
-    primary_layer1 = Layer1Config(symbol=primary_symbol)
-    primary_layer3 = Layer3Config(symbol=primary_symbol, execution_mode=args.mode)
-    if args.no_telegram:
-        primary_layer3.telegram.enabled = False
-
     if (
         primary_layer3.telegram.enabled
         and primary_layer3.telegram.health_enabled
@@ -391,64 +640,67 @@ async def main() -> None:
 
         from project_phantom.layer3.notifiers.telegram_health import TelegramHealthService
 
-        async def _build_health_report() -> str:
-            api_checks = await run_public_api_checks(
-                primary_layer0.endpoints,
-                whale_alert_enabled=primary_layer1.whale_alert.enabled,
-                whale_alert_api_key=primary_layer1.whale_alert.api_key,
-            )
-            binance_auth = await run_binance_auth_check(
-                enabled=primary_layer3.enable_execution,
-                mode=primary_layer3.execution_mode,
-                api_key=primary_layer3.binance.api_key,
-                api_secret=primary_layer3.binance.api_secret,
-                testnet=primary_layer3.binance.testnet,
-            )
-            return format_health_report(
-                symbol=symbol_scope,
-                mode=primary_layer3.execution_mode,
-                queue_sizes=_aggregate_queue_sizes(runtimes, execution_queue),
-                counters=_aggregate_counters(runtimes),
-                api_checks=api_checks,
-                binance_auth_check=binance_auth,
-                env_presence={
-                    "TG_BOT_TOKEN": bool(primary_layer3.telegram.bot_token),
-                    "TG_CHAT_ID": bool(primary_layer3.telegram.chat_id),
-                    "BINANCE_API_KEY": bool(primary_layer3.binance.api_key),
-                    "BINANCE_API_SECRET": bool(primary_layer3.binance.api_secret),
-                },
-            )
-
-        async def _build_stats_report() -> str:
-            return _format_stats_report(
-                symbol_scope=symbol_scope,
-                queue_sizes=_aggregate_queue_sizes(runtimes, execution_queue),
-                counters=_aggregate_counters(runtimes),
-                runtimes=runtimes,
-            )
-
-        async def _build_mode_report() -> str:
-            return _format_mode_report(
-                symbol_scope=symbol_scope,
-                symbol_count=len(symbols),
-                layer3=primary_layer3,
-            )
+        # Config is fixed for the process lifetime, so the static pieces are rendered once.
+        env_presence = {
+            "TG_BOT_TOKEN": bool(primary_layer3.telegram.bot_token),
+            "TG_CHAT_ID": bool(primary_layer3.telegram.chat_id),
+            "BINANCE_API_KEY": bool(primary_layer3.binance.api_key),
+            "BINANCE_API_SECRET": bool(primary_layer3.binance.api_secret),
+        }
+        mode_report = _format_mode_report(
+            symbol_scope=symbol_scope,
+            symbol_count=len(symbols),
+            layer3=primary_layer3,
+        )
 
         health_service = TelegramHealthService(
             bot=Bot(token=primary_layer3.telegram.bot_token),
             allowed_chat_id=primary_layer3.telegram.chat_id,
             command_handlers={
-                "/health": _build_health_report,
-                "/stats": _build_stats_report,
-                "/mode": _build_mode_report,
+                "/health": partial(
+                    _build_health_report,
+                    pipeline=pipeline,
+                    execution_queue=execution_queue,
+                    layer_depths=layer_depths,
+                    symbol_scope=symbol_scope,
+                    layer0=primary_layer0,
+                    layer1=primary_layer1,
+                    layer3=primary_layer3,
+                    env_presence=env_presence,
+                ),
+                "/stats": partial(
+                    _build_stats_report,
+                    pipeline=pipeline,
+                    execution_queue=execution_queue,
+                    layer_depths=layer_depths,
+                    symbol_scope=symbol_scope,
+                ),
+                "/mode": partial(_build_mode_report, mode_report),
             },
             poll_interval_seconds=primary_layer3.telegram.health_poll_interval_seconds,
             cooldown_seconds=primary_layer3.telegram.health_cooldown_seconds,
+            long_poll_timeout_seconds=primary_layer3.telegram.health_long_poll_timeout_seconds,
+            offset_path=primary_layer3.telegram.health_offset_path,
         )
-        tasks.append(asyncio.create_task(health_service.run(stop_event), name="telegram-health"))
+        telegram_config = primary_layer3.telegram
+        if telegram_config.health_webhook_url:
+            health_coro = health_service.run_webhook(
+                stop_event,
+                public_url=telegram_config.health_webhook_url,
+                secret_token=telegram_config.health_webhook_secret or secrets.token_urlsafe(24),
+                host=telegram_config.health_webhook_host,
+                port=telegram_config.health_webhook_port,
+            )
+        else:
+            health_coro = health_service.run(stop_event)
+        tasks.append(asyncio.create_task(health_coro, name="telegram-health"))
 
     try:
-        await asyncio.gather(*tasks)
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if not task.cancelled():
+                # Re-raise the first layer failure; the finally block tears down the rest.
+                task.result()
     except asyncio.CancelledError:
         raise
     finally:
@@ -456,8 +708,18 @@ async def main() -> None:
         for task in tasks:
             task.cancel()
         await asyncio.gather(*tasks, return_exceptions=True)
+        await close_health_session()
+
+
+def _use_uvloop_if_available() -> None:
+    try:
+        import uvloop  # type: ignore
+    except ModuleNotFoundError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 if __name__ == "__main__":
+    _use_uvloop_if_available()
     with contextlib.suppress(KeyboardInterrupt):
         asyncio.run(main())
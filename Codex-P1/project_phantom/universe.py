@@ -1,57 +1,92 @@
 from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
 from typing import Any
 
 import aiohttp
 
 from project_phantom.config import ExchangeEndpoints
+from project_phantom.core.jsonio import json_loads
+
+# How long the current Binance host gets before the next fallback host is also asked.
+_BINANCE_HEDGE_DELAY_SECONDS = 2.0
+
+_SESSION: aiohttp.ClientSession | None = None
+_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    # Discovery hits the same Binance host twice and may be re-run, so keep pooled keep-alive connections.
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        _SESSION = aiohttp.ClientSession(
+            headers={"User-Agent": "project-phantom/1.0"},
+            connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60),
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+
+async def close_discovery_session() -> None:
+    global _SESSION, _SESSION_LOOP
+    session = _SESSION
+    _SESSION = None
+    _SESSION_LOOP = None
+    if session is not None and not session.closed:
+        await session.close()
 
 
 def parse_binance_usdt_perpetual_symbols(payload: dict[str, Any]) -> set[str]:
-    symbols: set[str] = set()
-    for row in payload.get("symbols", []):
-        if str(row.get("contractType", "")).upper() != "PERPETUAL":
-            continue
-        if str(row.get("status", "")).upper() != "TRADING":
-            continue
-        if str(row.get("quoteAsset", "")).upper() != "USDT":
-            continue
-        symbol = str(row.get("symbol", "")).upper()
-        if symbol and symbol.endswith("USDT"):
-            symbols.add(symbol)
-    return symbols
+    # Binance already returns canonical uppercase enums; only the symbol is normalized defensively.
+    return {
+        symbol
+        for row in payload.get("symbols", ())
+        if row.get("contractType") == "PERPETUAL"
+        and row.get("status") == "TRADING"
+        and row.get("quoteAsset") == "USDT"
+        and (symbol := str(row.get("symbol", "")).upper()).endswith("USDT")
+    }
+
+
+def _is_usdt_trading(row: dict[str, Any]) -> bool:
+    # Bybit sends "Trading"/"USDT" verbatim, so the exact compares settle nearly every row without str().upper().
+    status = row.get("status")
+    if status and status != "Trading" and str(status).upper() != "TRADING":
+        return False
+    settle = row.get("settleCoin", "")
+    return settle == "USDT" or str(settle).upper() == "USDT"
 
 
 def parse_bybit_linear_usdt_symbols(payload: dict[str, Any]) -> set[str]:
-    symbols: set[str] = set()
-    rows = payload.get("result", {}).get("list", [])
-    for row in rows:
-        status = str(row.get("status", "")).upper()
-        if status and status != "TRADING":
-            continue
-        if str(row.get("settleCoin", "")).upper() != "USDT":
-            continue
-        symbol = str(row.get("symbol", "")).upper()
-        if symbol and symbol.endswith("USDT"):
-            symbols.add(symbol)
-    return symbols
+    rows = payload.get("result", {}).get("list", ())
+    return {
+        symbol
+        for row in rows
+        if _is_usdt_trading(row) and (symbol := str(row.get("symbol", "")).upper()).endswith("USDT")
+    }
 
 
-def parse_binance_quote_volume(payload: list[dict[str, Any]]) -> dict[str, float]:
-    volumes: dict[str, float] = {}
+def _iter_quote_volumes(payload: list[dict[str, Any]]) -> Iterator[tuple[str, float]]:
     for row in payload:
-        symbol = str(row.get("symbol", "")).upper()
+        symbol = row.get("symbol")
         if not symbol:
             continue
         try:
-            volume = float(row.get("quoteVolume", 0.0))
+            yield str(symbol).upper(), float(row.get("quoteVolume", 0.0))
         except (TypeError, ValueError):
             continue
-        volumes[symbol] = volume
-    return volumes
+
+
+def parse_binance_quote_volume(payload: list[dict[str, Any]]) -> dict[str, float]:
+    return dict(_iter_quote_volumes(payload))
 
 
 def rank_symbols_by_quote_volume(symbols: set[str], quote_volume_map: dict[str, float]) -> list[str]:
-    return sorted(symbols, key=lambda item: (-quote_volume_map.get(item, 0.0), item))
+    keyed = [(-quote_volume_map.get(symbol, 0.0), symbol) for symbol in symbols]
+    keyed.sort()
+    return [symbol for _, symbol in keyed]
 
 
 async def _safe_get_json(
@@ -65,7 +100,7 @@ async def _safe_get_json(
         async with session.get(url, params=params, timeout=timeout_seconds) as response:
             if response.status >= 400:
                 return None
-            return await response.json()
+            return json_loads(await response.read())
     except Exception:
         return None
 
@@ -107,36 +142,63 @@ async def _fetch_binance_quote_volumes(session: aiohttp.ClientSession, rest_base
     return parse_binance_quote_volume(payload)
 
 
+async def _race_binance_symbols(session: aiohttp.ClientSession, bases: list[str]) -> tuple[str | None, set[str]]:
+    # Hedged, not broadcast: the primary goes alone and each fallback host only joins once the
+    # hosts before it have failed or stayed silent for the hedge delay. This keeps request weight
+    # (and 418/429 risk) on one host in the normal case.
+    async def _tagged(base: str) -> tuple[str, set[str]]:
+        return base, await _fetch_binance_symbols(session, base)
+
+    waiting = list(bases)
+    pending: set[asyncio.Task[tuple[str, set[str]]]] = set()
+    try:
+        while waiting or pending:
+            if waiting:
+                pending.add(asyncio.create_task(_tagged(waiting.pop(0))))
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=_BINANCE_HEDGE_DELAY_SECONDS if waiting else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            # Earlier hosts win ties so the primary stays preferred.
+            for base, symbols in sorted((task.result() for task in done), key=lambda item: bases.index(item[0])):
+                if symbols:
+                    return base, symbols
+        return None, set()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 async def discover_common_futures_symbols(
     endpoints: ExchangeEndpoints,
     *,
     max_symbols: int = 0,
 ) -> list[str]:
-    async with aiohttp.ClientSession(headers={"User-Agent": "project-phantom/1.0"}) as session:
-        # Try primary + fallback Binance REST hosts to avoid temporary 418 blocks.
-        binance_bases = [endpoints.binance_rest, "https://fapi1.binance.com", "https://fapi2.binance.com", "https://fapi3.binance.com"]
-        binance_symbols: set[str] = set()
-        quote_volumes: dict[str, float] = {}
-        for base in binance_bases:
-            symbols = await _fetch_binance_symbols(session, base)
-            if symbols:
-                binance_symbols = symbols
-                quote_volumes = await _fetch_binance_quote_volumes(session, base)
-                break
-
-        bybit_symbols = await _fetch_bybit_symbols(session, endpoints.bybit_rest)
-
-        if binance_symbols and bybit_symbols:
-            selected = binance_symbols & bybit_symbols
-        elif bybit_symbols:
-            selected = bybit_symbols
-        else:
-            selected = binance_symbols
-
-        if not selected:
-            return []
-
-        ranked = rank_symbols_by_quote_volume(selected, quote_volumes)
-        if max_symbols > 0:
-            return ranked[:max_symbols]
-        return ranked
+    session = _get_session()
+    # Primary Binance REST host with hedged fallbacks (avoids temporary 418 blocks) while Bybit loads.
+    binance_bases = [endpoints.binance_rest, "https://fapi1.binance.com", "https://fapi2.binance.com", "https://fapi3.binance.com"]
+    bybit_task = asyncio.create_task(_fetch_bybit_symbols(session, endpoints.bybit_rest))
+    try:
+        base, binance_symbols = await _race_binance_symbols(session, binance_bases)
+        quote_volumes = await _fetch_binance_quote_volumes(session, base) if base else {}
+        bybit_symbols = await bybit_task
+    finally:
+        bybit_task.cancel()
+
+    if binance_symbols and bybit_symbols:
+        # Intersect in place; the smaller Binance set is freshly parsed and owned here.
+        binance_symbols.intersection_update(bybit_symbols)
+        selected = binance_symbols
+    elif bybit_symbols:
+        selected = bybit_symbols
+    else:
+        selected = binance_symbols
+
+    if not selected:
+        return []
+
+    ranked = rank_symbols_by_quote_volume(selected, quote_volumes)
+    if max_symbols > 0:
+        return ranked[:max_symbols]
+    return ranked
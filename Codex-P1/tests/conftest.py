@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+
+import pytest
+
+if importlib.util.find_spec("uvloop") is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+        import uvloop  # type: ignore
+
+        return uvloop.EventLoopPolicy()
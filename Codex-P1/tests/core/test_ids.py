@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import uuid
+
+from project_phantom.core.ids import new_event_id
+
+
+def test_new_event_id_is_canonical_uuid4() -> None:
+    value = new_event_id()
+    parsed = uuid.UUID(value)
+    assert str(parsed) == value
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_new_event_id_is_unique_across_pool_refills() -> None:
+    ids = {new_event_id() for _ in range(1000)}
+    assert len(ids) == 1000
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import asyncio
+from array import array
+
+import pytest
+
+from project_phantom.core.ringq import RingQueue
+
+
+@pytest.mark.asyncio
+async def test_ring_queue_wraps_and_preserves_fifo_order() -> None:
+    queue: RingQueue[int] = RingQueue(3)
+    for value in (1, 2, 3):
+        queue.put_nowait(value)
+    assert queue.full()
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(4)
+
+    assert queue.get_nowait() == 1
+    queue.put_nowait(4)
+    assert await queue.get_batch(10) == [2, 3, 4]
+    assert queue.empty()
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+@pytest.mark.asyncio
+async def test_ring_queue_get_wakes_on_put_and_honours_timeout() -> None:
+    queue: RingQueue[str] = RingQueue(2)
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(queue.get(), timeout=0.01)
+
+    getter = asyncio.create_task(queue.get())
+    await asyncio.sleep(0)
+    await queue.put("a")
+    assert await asyncio.wait_for(getter, timeout=1) == "a"
+
+
+def test_ring_queues_share_a_running_depth_total() -> None:
+    depths = array("q", [0, 0])
+    first: RingQueue[int] = RingQueue(4, depths=depths, depth_slot=1)
+    second: RingQueue[int] = RingQueue(4, depths=depths, depth_slot=1)
+    first.put_nowait(1)
+    second.put_nowait(2)
+    second.put_nowait(3)
+    assert list(depths) == [0, 3]
+    second.get_nowait()
+    assert list(depths) == [0, 2]
@@ -6,6 +6,7 @@ from project_phantom.config import Layer0Config, SignalWeights, ThresholdConfig
 from project_phantom.core.types import LiquidationUpdate, SignalBreakdown
 from project_phantom.layer0.liquidation_book import LiquidationBook
 from project_phantom.layer0.signals import (
+    SortedScoreWindow,
     compute_adaptive_threshold,
     compute_directional_score,
     compute_funding_oi_scores,
@@ -63,6 +64,29 @@ def test_liquidation_proximity_scores_mixed_events() -> None:
     assert prox.short_distance_pct is not None
 
 
+def test_liquidation_book_add_many_matches_single_adds() -> None:
+    now_ms = 1_000_000
+    events = [
+        LiquidationUpdate(
+            exchange="binance",
+            symbol="BTCUSDT",
+            price=10_000.0 + offset,
+            quantity=1.0,
+            notional=10_000.0 + offset,
+            liquidated_side="SHORT" if offset > 0 else "LONG",
+            ts_ms=now_ms - abs(offset) * 1_000,
+        )
+        for offset in (150.0, -150.0, 260.0, -90.0)
+    ]
+    single = LiquidationBook(window_minutes=90, bin_size=100.0, decay_minutes=45.0)
+    for event in events:
+        single.add(event)
+    batched = LiquidationBook(window_minutes=90, bin_size=100.0, decay_minutes=45.0)
+    batched.add_many(events)
+
+    assert batched.proximity_scores(10_000.0, now_ms) == single.proximity_scores(10_000.0, now_ms)
+
+
 def test_funding_oi_regime_switch_prefers_long_on_negative_funding() -> None:
     thresholds = ThresholdConfig()
     low_long, low_short, low_meta = compute_funding_oi_scores(
@@ -151,3 +175,18 @@ def test_adaptive_threshold_respects_floor_and_quantile() -> None:
     )
     assert dynamic >= 0.70
     assert dynamic <= config.ceiling
+
+
+def test_sorted_score_window_matches_full_sort_threshold() -> None:
+    config = Layer0Config().adaptive_gate
+    observed = [((idx * 37) % 100) / 100.0 for idx in range(config.window_cycles + 60)]
+    window = SortedScoreWindow(config.window_cycles)
+    for score in observed:
+        window.append(score)
+
+    recent = observed[-config.window_cycles :]
+    assert len(window) == config.window_cycles
+    assert window.ranked == sorted(recent)
+    assert compute_adaptive_threshold(window.ranked, config, 0.70, presorted=True) == compute_adaptive_threshold(
+        recent, config, 0.70
+    )
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from dataclasses import dataclass
 from typing import AsyncIterator
 
 import pytest
 
 from project_phantom.config import AdaptiveGateConfig, BackoffConfig, Layer0Config, RegimeFilterConfig
+from project_phantom.core.clock import now_ms
+from project_phantom.core.ringq import RingQueue
 from project_phantom.core.types import ExchangeSnapshot, LiquidationUpdate, SignalBreakdown, TrapSetupEvent
 from project_phantom.layer0.trap_detector import run_layer0
 
@@ -32,7 +33,7 @@ class FakeClient:
             raise RuntimeError(self.fail_with)
 
         self._calls += 1
-        ts_ms = int(time.time() * 1000)
+        ts_ms = now_ms()
         oi = self.base_oi + (self.oi_step * self._calls)
         return ExchangeSnapshot(
             exchange=self.name,
@@ -56,11 +57,10 @@ class FakeClient:
                 quantity=qty,
                 notional=price * qty,
                 liquidated_side=self.liquidation_side,  # type: ignore[arg-type]
-                ts_ms=int(time.time() * 1000),
+                ts_ms=now_ms(),
             )
 
-        while True:
-            await asyncio.sleep(1)
+        await asyncio.Event().wait()
 
     async def close(self) -> None:
         return None
@@ -111,7 +111,7 @@ def _old_event() -> TrapSetupEvent:
 
 @pytest.mark.asyncio
 async def test_queue_drop_oldest_policy() -> None:
-    queue: asyncio.Queue[TrapSetupEvent] = asyncio.Queue(maxsize=1)
+    queue: RingQueue[TrapSetupEvent] = RingQueue(1)
     queue.put_nowait(_old_event())
 
     config = _base_config(queue_maxsize=1)
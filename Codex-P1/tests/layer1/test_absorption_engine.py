@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from dataclasses import dataclass
 from typing import AsyncIterator
 
 import pytest
 
-from project_phantom.config import BackoffConfig, Layer1Config, WhaleAlertConfig
+from project_phantom.config import BackoffConfig, Layer1Config, Layer1ThresholdConfig, WhaleAlertConfig
+from project_phantom.core.clock import now_ms
+from project_phantom.core.ringq import RingQueue
 from project_phantom.core.types import (
     AbsorptionBreakdown,
     AbsorptionEvent,
@@ -28,8 +29,7 @@ class FakeTradeClient:
         for trade in self.trades:
             yield trade
             await asyncio.sleep(0.005)
-        while True:
-            await asyncio.sleep(1)
+        await asyncio.Event().wait()
 
     async def close(self) -> None:
         return None
@@ -44,8 +44,7 @@ class FakeBookClient:
         for book in self.books:
             yield book
             await asyncio.sleep(0.005)
-        while True:
-            await asyncio.sleep(1)
+        await asyncio.Event().wait()
 
     async def close(self) -> None:
         return None
@@ -55,7 +54,7 @@ def _trap_event(direction: str = "LONG") -> TrapSetupEvent:
     return TrapSetupEvent(
         event_type="TRAP_SETUP_EVENT",
         event_id=f"trap-{direction.lower()}",
-        ts_ms=int(time.time() * 1000),
+        ts_ms=now_ms(),
         symbol="BTCUSDT",
         direction=direction,  # type: ignore[arg-type]
         score=0.8,
@@ -99,24 +98,22 @@ def _seed_absorption_event() -> AbsorptionEvent:
 
 
 def _trade_samples() -> list[TradeTick]:
-    base = int(time.time() * 1000)
-    rows: list[TradeTick] = []
-    for idx in range(12):
-        rows.append(
-            TradeTick(
-                exchange="binance",
-                symbol="BTCUSDT",
-                price=10_000 + idx,
-                quantity=20.0,
-                is_buyer_maker=False,
-                ts_ms=base + (idx * 1_000),
-            )
+    base = now_ms()
+    return [
+        TradeTick(
+            exchange="binance",
+            symbol="BTCUSDT",
+            price=10_000 + idx,
+            quantity=20.0,
+            is_buyer_maker=False,
+            ts_ms=base + idx * 1_000,
         )
-    return rows
+        for idx in range(12)
+    ]
 
 
 def _book_samples() -> list[OrderBookTick]:
-    base = int(time.time() * 1000)
+    base = now_ms()
     return [
         OrderBookTick(
             exchange="binance",
@@ -131,20 +128,18 @@ def _book_samples() -> list[OrderBookTick]:
     ]
 
 
-def _layer1_config(*, whale_alert_enabled: bool = False) -> Layer1Config:
-    config = Layer1Config(
+def _layer1_config(*, whale_alert_enabled: bool = False, enable_binance_orderbook: bool = False) -> Layer1Config:
+    return Layer1Config(
         symbol="BTCUSDT",
         cadence_seconds=0.05,
         trade_window_seconds=300,
         setup_ttl_seconds=180,
         min_trades_for_metrics=5,
+        thresholds=Layer1ThresholdConfig(score_threshold=0.45, min_component_hits=2),
         whale_alert=WhaleAlertConfig(enabled=whale_alert_enabled, poll_interval_seconds=0.05),
-        enable_binance_orderbook=False,
+        enable_binance_orderbook=enable_binance_orderbook,
         backoff=BackoffConfig(min_seconds=0.05, max_seconds=0.2),
     )
-    config.thresholds.score_threshold = 0.45
-    config.thresholds.min_component_hits = 2
-    return config
 
 
 @pytest.mark.asyncio
@@ -178,8 +173,8 @@ async def test_layer1_emits_absorption_event_for_active_long_setup() -> None:
 
 @pytest.mark.asyncio
 async def test_layer1_queue_drop_oldest_policy() -> None:
-    in_queue: asyncio.Queue[TrapSetupEvent] = asyncio.Queue()
-    out_queue: asyncio.Queue[AbsorptionEvent] = asyncio.Queue(maxsize=1)
+    in_queue: RingQueue[TrapSetupEvent] = RingQueue(1)
+    out_queue: RingQueue[AbsorptionEvent] = RingQueue(1)
     out_queue.put_nowait(_seed_absorption_event())
     stop_event = asyncio.Event()
     in_queue.put_nowait(_trap_event("LONG"))
@@ -239,8 +234,7 @@ async def test_layer1_includes_orderbook_microstructure_metrics() -> None:
     stop_event = asyncio.Event()
     in_queue.put_nowait(_trap_event("LONG"))
 
-    config = _layer1_config()
-    config.enable_binance_orderbook = True
+    config = _layer1_config(enable_binance_orderbook=True)
     trade_client = FakeTradeClient(name="fake-trades", trades=_trade_samples())
     book_client = FakeBookClient(name="fake-book", books=_book_samples())
     task = asyncio.create_task(
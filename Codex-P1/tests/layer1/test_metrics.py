@@ -9,6 +9,7 @@ from project_phantom.layer1.metrics import (
     compute_cvd_scores,
     compute_orderbook_imbalance_scores,
     compute_sweep_aggression_scores,
+    compute_trade_flow_scores,
     compute_twap_uniformity_scores,
     compute_whale_net_flow_scores,
     passes_absorption_gate,
@@ -144,3 +145,26 @@ def test_sweep_aggression_scores_detects_buy_sweep() -> None:
     assert max_buy_sweep > 0
     assert max_sell_sweep <= 0
     assert long_score > short_score
+
+
+def test_trade_flow_scores_match_individual_metrics() -> None:
+    thresholds = Layer1ThresholdConfig()
+    trades = [
+        _trade(1_000 + idx * 700, price=10_000 + idx, qty=4 + (idx % 5) * 6, is_buyer_maker=idx % 3 == 0)
+        for idx in range(20)
+    ]
+    whale, twap, sweep = compute_trade_flow_scores(trades, thresholds)
+    assert whale == compute_whale_net_flow_scores(
+        trades=trades,
+        min_notional=thresholds.whale_notional_usd,
+        scale_usd=thresholds.whale_flow_scale_usd,
+    )
+    assert twap == compute_twap_uniformity_scores(
+        trades=trades,
+        min_notional=thresholds.whale_notional_usd,
+        cv_limit=thresholds.twap_interval_cv_limit,
+    )
+    assert sweep == compute_sweep_aggression_scores(
+        trades=trades,
+        scale_usd=thresholds.sweep_aggression_scale_usd,
+    )
@@ -1,21 +1,23 @@
 from __future__ import annotations
 
 import asyncio
-import time
 from dataclasses import dataclass
 from typing import Any
 
 import pytest
 
 from project_phantom.config import BackoffConfig, Layer2Config, Layer2ThresholdConfig
+from project_phantom.core.clock import now_ms
 from project_phantom.core.types import (
     AbsorptionBreakdown,
     AbsorptionEvent,
     Candle,
+    HealthCounters,
     IgnitionBreakdown,
     PrePumpEvent,
 )
 from project_phantom.layer2.ignition_engine import run_layer2
+from tests.helpers import wait_until
 
 
 @dataclass
@@ -45,8 +47,12 @@ class FakeSMCDetector:
         return (self.choch, self.order_block, {"backend": "fake"})
 
 
+# Layer2 only reads candle prices, never their age, so the series can sit on a fixed clock.
+_CANDLE_CLOCK_MS = 1_700_000_000_000
+
+
 def _candles(momentum: str = "up") -> list[Candle]:
-    base = int(time.time() * 1000) - 20 * 60_000
+    base = _CANDLE_CLOCK_MS - 20 * 60_000
     rows: list[Candle] = []
     for idx in range(20):
         if momentum == "up":
@@ -73,7 +79,7 @@ def _absorption_event(*, direction: str = "LONG", score: float = 0.8, trap_score
     return AbsorptionEvent(
         event_type="ABSORPTION_EVENT",
         event_id=f"abs-{direction.lower()}",
-        ts_ms=int(time.time() * 1000),
+        ts_ms=now_ms(),
         symbol="BTCUSDT",
         direction=direction,  # type: ignore[arg-type]
         score=score,
@@ -154,9 +160,11 @@ async def test_layer2_emits_pre_pump_event_on_3_of_5() -> None:
             smc_detector=FakeSMCDetector(choch=False, order_block=False),
         )
     )
-    await asyncio.sleep(0.4)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: not out_queue.empty())
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert not out_queue.empty()
     event = out_queue.get_nowait()
@@ -188,6 +196,7 @@ async def test_layer2_does_not_emit_below_min_confirmations() -> None:
     stop_event.set()
     await asyncio.wait_for(task, timeout=1)
 
+    assert in_queue.empty()
     assert out_queue.empty()
 
 
@@ -196,6 +205,7 @@ async def test_layer2_queue_drop_oldest_policy() -> None:
     in_queue: asyncio.Queue[AbsorptionEvent] = asyncio.Queue()
     out_queue: asyncio.Queue[PrePumpEvent] = asyncio.Queue(maxsize=1)
     stop_event = asyncio.Event()
+    health = HealthCounters()
     out_queue.put_nowait(_seed_pre_pump())
     in_queue.put_nowait(_absorption_event(direction="LONG", score=0.8, trap_score=0.9))
 
@@ -207,11 +217,14 @@ async def test_layer2_queue_drop_oldest_policy() -> None:
             stop_event=stop_event,
             candle_client=FakeCandleClient(name="candles", candles=_candles("up")),
             smc_detector=FakeSMCDetector(choch=False, order_block=False),
+            health=health,
         )
     )
-    await asyncio.sleep(0.4)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: health.emitted_events > 0)
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert out_queue.qsize() == 1
     latest = out_queue.get_nowait()
@@ -235,9 +248,11 @@ async def test_layer2_marks_degraded_when_smc_fails_but_still_emits() -> None:
             smc_detector=FakeSMCDetector(fail=True),
         )
     )
-    await asyncio.sleep(0.4)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: not out_queue.empty())
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert not out_queue.empty()
     event = out_queue.get_nowait()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -16,8 +16,10 @@ from project_phantom.config import (
     Layer3SizingConfig,
     TelegramConfig,
 )
-from project_phantom.core.types import ExecutionEvent, IgnitionBreakdown, PrePumpEvent
+from project_phantom.core.clock import now_ms
+from project_phantom.core.types import ExecutionEvent, HealthCounters, IgnitionBreakdown, PrePumpEvent
 from project_phantom.layer3.executor import run_layer3
+from tests.helpers import wait_until
 
 
 @dataclass
@@ -25,9 +27,12 @@ class FakeExecutionClient:
     name: str = "fake_exec"
     calls: list[dict[str, Any]] = field(default_factory=list)
     next_id: int = 1
+    reject: Callable[[dict[str, Any]], bool] = lambda kwargs: False
 
     async def futures_create_order(self, **kwargs: Any) -> dict[str, Any]:
         self.calls.append(kwargs)
+        if self.reject(kwargs):
+            raise RuntimeError(f"{kwargs['type']} rejected")
         order = {"orderId": str(self.next_id)}
         self.next_id += 1
         if kwargs.get("type") == "MARKET":
@@ -54,7 +59,7 @@ def _pre_pump_event(direction: str = "LONG") -> PrePumpEvent:
     return PrePumpEvent(
         event_type="PRE_PUMP_EVENT",
         event_id=f"pre-{direction.lower()}",
-        ts_ms=int(time.time() * 1000),
+        ts_ms=now_ms(),
         symbol="BTCUSDT",
         direction=direction,  # type: ignore[arg-type]
         score=0.8,
@@ -129,9 +134,11 @@ async def test_layer3_executes_orders_and_sends_telegram() -> None:
             telegram_notifier=tg_client,
         )
     )
-    await asyncio.sleep(0.35)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: not out_queue.empty())
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert len(exec_client.calls) == 4
     assert exec_client.calls[0]["type"] == "MARKET"
@@ -143,11 +150,83 @@ async def test_layer3_executes_orders_and_sends_telegram() -> None:
     assert "PHANTOM SIGNAL - BTCUSDT" in tg_client.messages[0]
 
 
+@pytest.mark.asyncio
+async def test_layer3_rejected_stop_loss_sends_no_take_profits() -> None:
+    in_queue: asyncio.Queue[PrePumpEvent] = asyncio.Queue()
+    out_queue: asyncio.Queue[ExecutionEvent] = asyncio.Queue(maxsize=10)
+    stop_event = asyncio.Event()
+    exec_client = FakeExecutionClient(reject=lambda kwargs: kwargs["type"] == "STOP_MARKET")
+    tg_client = FakeTelegramNotifier()
+
+    in_queue.put_nowait(_pre_pump_event("LONG"))
+    task = asyncio.create_task(
+        run_layer3(
+            _config("live"),
+            in_queue,
+            out_queue=out_queue,
+            stop_event=stop_event,
+            execution_client=exec_client,
+            telegram_notifier=tg_client,
+        )
+    )
+    try:
+        await wait_until(lambda: bool(tg_client.messages))
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
+
+    assert [call["type"] for call in exec_client.calls] == ["MARKET", "STOP_MARKET"]
+    assert out_queue.empty()
+    assert "PHANTOM EXECUTION ERROR" in tg_client.messages[0]
+
+
+@pytest.mark.asyncio
+async def test_layer3_rejected_take_profit_reports_live_sibling() -> None:
+    in_queue: asyncio.Queue[PrePumpEvent] = asyncio.Queue()
+    out_queue: asyncio.Queue[ExecutionEvent] = asyncio.Queue(maxsize=10)
+    stop_event = asyncio.Event()
+    take_profits: list[dict[str, Any]] = []
+
+    def _reject_first_take_profit(kwargs: dict[str, Any]) -> bool:
+        if kwargs["type"] != "TAKE_PROFIT_MARKET":
+            return False
+        take_profits.append(kwargs)
+        return len(take_profits) == 1
+
+    exec_client = FakeExecutionClient(reject=_reject_first_take_profit)
+    tg_client = FakeTelegramNotifier()
+
+    in_queue.put_nowait(_pre_pump_event("LONG"))
+    task = asyncio.create_task(
+        run_layer3(
+            _config("live"),
+            in_queue,
+            out_queue=out_queue,
+            stop_event=stop_event,
+            execution_client=exec_client,
+            telegram_notifier=tg_client,
+        )
+    )
+    try:
+        await wait_until(lambda: bool(tg_client.messages))
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
+
+    assert [call["type"] for call in exec_client.calls] == ["MARKET", "STOP_MARKET", "TAKE_PROFIT_MARKET", "TAKE_PROFIT_MARKET"]
+    assert out_queue.empty()
+    notice = tg_client.messages[0]
+    assert "PHANTOM EXECUTION ERROR" in notice
+    assert "tp1: TAKE_PROFIT_MARKET rejected" in notice
+    assert "live orders: entry=1 sl=2 tp2=3" in notice
+
+
 @pytest.mark.asyncio
 async def test_layer3_queue_drop_oldest_policy() -> None:
     in_queue: asyncio.Queue[PrePumpEvent] = asyncio.Queue()
     out_queue: asyncio.Queue[ExecutionEvent] = asyncio.Queue(maxsize=1)
     stop_event = asyncio.Event()
+    health = HealthCounters()
     exec_client = FakeExecutionClient()
     tg_client = FakeTelegramNotifier()
 
@@ -175,11 +254,14 @@ async def test_layer3_queue_drop_oldest_policy() -> None:
             stop_event=stop_event,
             execution_client=exec_client,
             telegram_notifier=tg_client,
+            health=health,
         )
     )
-    await asyncio.sleep(0.35)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: health.emitted_events > 0)
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert out_queue.qsize() == 1
     latest = out_queue.get_nowait()
@@ -205,9 +287,11 @@ async def test_layer3_paper_mode_still_sends_telegram() -> None:
             telegram_notifier=tg_client,
         )
     )
-    await asyncio.sleep(0.35)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: not out_queue.empty())
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert not out_queue.empty()
     event = out_queue.get_nowait()
@@ -240,9 +324,12 @@ async def test_layer3_guard_cooldown_blocks_second_entry() -> None:
             telegram_notifier=tg_client,
         )
     )
-    await asyncio.sleep(0.45)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: in_queue.empty() and not out_queue.empty())
+        await asyncio.sleep(0.1)
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     # First signal executes (4 orders), second is blocked by cooldown.
     assert len(exec_client.calls) == 4
@@ -277,9 +364,12 @@ async def test_layer3_guard_rate_limit_blocks_after_cap() -> None:
             telegram_notifier=tg_client,
         )
     )
-    await asyncio.sleep(0.45)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: in_queue.empty() and not out_queue.empty())
+        await asyncio.sleep(0.1)
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     # Only first signal executes due to per-hour limit.
     assert len(exec_client.calls) == 4
@@ -309,9 +399,12 @@ async def test_layer3_session_filter_blocks_outside_hours() -> None:
             telegram_notifier=tg_client,
         )
     )
-    await asyncio.sleep(0.35)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(in_queue.empty)
+        await asyncio.sleep(0.1)
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert len(exec_client.calls) == 0
     assert out_queue.qsize() == 0
@@ -341,9 +434,11 @@ async def test_layer3_adaptive_sizing_changes_quantity() -> None:
             telegram_notifier=tg_client,
         )
     )
-    await asyncio.sleep(0.35)
-    stop_event.set()
-    await asyncio.wait_for(task, timeout=1)
+    try:
+        await wait_until(lambda: not out_queue.empty())
+    finally:
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
 
     assert out_queue.qsize() == 1
     event = out_queue.get_nowait()
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
+import pytest
+
+from project_phantom.config import ExchangeEndpoints
 from project_phantom.core.types import HealthCounters
-from project_phantom.layer3.health_report import format_health_report
+from project_phantom.layer3.health_report import (
+    cached_run_public_api_checks,
+    close_health_session,
+    format_health_report,
+    run_public_api_checks,
+)
 
 
 def test_format_health_report_contains_pipeline_and_api_sections() -> None:
@@ -34,3 +45,66 @@ def test_format_health_report_contains_pipeline_and_api_sections() -> None:
     assert "BYBIT_PUBLIC" in report
     assert "q_layer3             : 4" in report
     assert "layer3              : emitted=8" in report
+
+
+@pytest.mark.asyncio
+async def test_run_public_api_checks_probes_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _slow_check(*args, **kwargs):  # noqa: ANN001
+        await asyncio.sleep(0.2)
+        return (True, "reachable")
+
+    async def _failing_check(*args, **kwargs):  # noqa: ANN001
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("project_phantom.layer3.health_report._check_with_retries", _slow_check)
+    monkeypatch.setattr("project_phantom.layer3.health_report._okx_check_with_fallback", _failing_check)
+
+    started = time.perf_counter()
+    try:
+        checks = await run_public_api_checks(
+            ExchangeEndpoints(),
+            whale_alert_enabled=False,
+            whale_alert_api_key=None,
+        )
+    finally:
+        await close_health_session()
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    assert checks["BINANCE_PUBLIC"] == (True, "reachable")
+    assert checks["BYBIT_PUBLIC"] == (True, "reachable")
+    assert checks["OKX_PUBLIC"] == (False, "RuntimeError")
+    assert checks["WHALE_ALERT"] == (True, "disabled")
+
+
+@pytest.mark.asyncio
+async def test_cached_public_api_checks_reuses_and_coalesces(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    async def _checks(*args, **kwargs):  # noqa: ANN001
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"BINANCE_PUBLIC": (True, f"run_{len(calls)}")}
+
+    monkeypatch.setattr("project_phantom.layer3.health_report.run_public_api_checks", _checks)
+    endpoints = ExchangeEndpoints(binance_rest="https://cache-test.invalid")
+
+    first, second = await asyncio.gather(
+        cached_run_public_api_checks(endpoints, whale_alert_enabled=False, whale_alert_api_key=None),
+        cached_run_public_api_checks(endpoints, whale_alert_enabled=False, whale_alert_api_key=None),
+    )
+    assert len(calls) == 1
+    assert first == second
+
+    cached = await cached_run_public_api_checks(endpoints, whale_alert_enabled=False, whale_alert_api_key=None)
+    assert len(calls) == 1
+    assert cached == first
+
+    forced = await cached_run_public_api_checks(
+        endpoints,
+        whale_alert_enabled=False,
+        whale_alert_api_key=None,
+        force=True,
+    )
+    assert len(calls) == 2
+    assert forced["BINANCE_PUBLIC"] == (True, "run_2")
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import socket
 from dataclasses import dataclass, field
 from typing import Any
 
+import aiohttp
 import pytest
 
-from project_phantom.layer3.notifiers.telegram_health import TelegramHealthService
+from project_phantom.layer3.notifiers.telegram_health import TelegramHealthService, _store_update_offset
 
 
 @dataclass
 class FakeBot:
     updates: list[dict[str, Any]]
     sent: list[dict[str, Any]] = field(default_factory=list)
+    webhook: dict[str, Any] | None = None
 
     async def get_updates(self, offset=None, timeout=0, allowed_updates=None):  # noqa: ANN001
         _ = (offset, timeout, allowed_updates)
@@ -23,16 +26,25 @@ class FakeBot:
     async def send_message(self, **kwargs: Any) -> None:
         self.sent.append(kwargs)
 
+    async def set_webhook(self, **kwargs: Any) -> bool:
+        self.webhook = kwargs
+        return True
+
+    async def delete_webhook(self, **kwargs: Any) -> bool:
+        self.webhook = None
+        return True
+
 
 @pytest.mark.asyncio
-async def test_telegram_health_service_replies_to_health_command() -> None:
+@pytest.mark.parametrize("chat_id", ["123", 123])
+async def test_telegram_health_service_replies_to_health_command(chat_id: str | int) -> None:
     bot = FakeBot(
         updates=[
             {
                 "update_id": 1,
                 "message": {
                     "text": "/health",
-                    "chat": {"id": "123"},
+                    "chat": {"id": chat_id},
                 },
             }
         ]
@@ -100,7 +112,7 @@ async def test_telegram_health_service_supports_stats_and_mode_commands() -> Non
     bot = FakeBot(
         updates=[
             {"update_id": 3, "message": {"text": "/stats", "chat": {"id": "123"}}},
-            {"update_id": 4, "message": {"text": "/mode", "chat": {"id": "123"}}},
+            {"update_id": 4, "message": {"text": "/mode@PhantomBot", "chat": {"id": "123"}}},
         ]
     )
 
@@ -134,3 +146,213 @@ async def test_telegram_health_service_supports_stats_and_mode_commands() -> Non
     texts = [item["text"] for item in bot.sent]
     assert "<pre>STATS</pre>" in texts
     assert "<pre>MODE</pre>" in texts
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.mark.asyncio
+async def test_telegram_health_service_webhook_dispatches_and_checks_secret() -> None:
+    bot = FakeBot(updates=[])
+
+    async def builder() -> str:
+        return "<pre>OK</pre>"
+
+    stop_event = asyncio.Event()
+    service = TelegramHealthService(
+        bot=bot,
+        allowed_chat_id="123",
+        command_handlers={"/stats": builder},
+        cooldown_seconds=0.01,
+    )
+    port = _free_port()
+    task = asyncio.create_task(
+        service.run_webhook(
+            stop_event,
+            public_url="https://example.invalid/",
+            secret_token="s3cret",
+            host="127.0.0.1",
+            port=port,
+        )
+    )
+    await asyncio.sleep(0.1)
+    assert bot.webhook["url"] == "https://example.invalid/telegram/s3cret"
+
+    update = {"update_id": 5, "message": {"text": "/stats", "chat": {"id": "123"}}}
+    url = f"http://127.0.0.1:{port}/telegram/s3cret"
+    async with aiohttp.ClientSession() as session:
+        async with session.post(url, json=update) as response:
+            assert response.status == 403
+        async with session.post(url, json=update, headers={"X-Telegram-Bot-Api-Secret-Token": "s3cret"}) as response:
+            assert response.status == 200
+    await asyncio.sleep(0.05)
+    stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert [item["text"] for item in bot.sent] == ["<pre>OK</pre>"]
+    assert bot.webhook is None
+
+
+@pytest.mark.asyncio
+async def test_telegram_health_service_webhook_bind_failure_falls_back_to_polling(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    bot = FakeBot(updates=[{"update_id": 6, "message": {"text": "/stats", "chat": {"id": "123"}}}])
+
+    async def builder() -> str:
+        return "<pre>OK</pre>"
+
+    stop_event = asyncio.Event()
+    service = TelegramHealthService(
+        bot=bot,
+        allowed_chat_id="123",
+        command_handlers={"/stats": builder},
+        poll_interval_seconds=0.01,
+        cooldown_seconds=0.01,
+    )
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        busy.listen()
+        task = asyncio.create_task(
+            service.run_webhook(
+                stop_event,
+                public_url="https://example.invalid/",
+                secret_token="s3cret",
+                host="127.0.0.1",
+                port=busy.getsockname()[1],
+            )
+        )
+        await asyncio.sleep(0.1)
+        assert not task.done()
+        stop_event.set()
+        await asyncio.wait_for(task, timeout=1)
+
+    assert bot.webhook is None
+    assert [item["text"] for item in bot.sent] == ["<pre>OK</pre>"]
+    assert "falling back to getUpdates polling" in caplog.text
+
+
+@dataclass
+class HangingBot(FakeBot):
+    timeouts: list[int] = field(default_factory=list)
+    offsets: list[int | None] = field(default_factory=list)
+
+    async def get_updates(self, offset=None, timeout=0, allowed_updates=None):  # noqa: ANN001
+        self.timeouts.append(timeout)
+        self.offsets.append(offset)
+        if self.updates:
+            return await super().get_updates(offset, timeout, allowed_updates)
+        await asyncio.sleep(3600)
+        return []
+
+
+@pytest.mark.asyncio
+async def test_telegram_health_service_long_polls_and_persists_offset(tmp_path) -> None:  # noqa: ANN001
+    offset_path = tmp_path / "offset"
+    bot = HangingBot(updates=[{"update_id": 41, "message": {"text": "hi", "chat": {"id": "123"}}}])
+
+    async def builder() -> str:
+        return "OK"
+
+    stop_event = asyncio.Event()
+    service = TelegramHealthService(
+        bot=bot,
+        allowed_chat_id="123",
+        command_handlers={"/health": builder},
+        offset_path=str(offset_path),
+    )
+    task = asyncio.create_task(service.run(stop_event))
+    await asyncio.sleep(0.05)
+    stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+
+    assert bot.timeouts == [30, 30]
+    assert bot.offsets == [None, 42]
+    assert offset_path.read_text() == "41"
+
+    restarted = TelegramHealthService(
+        bot=bot,
+        allowed_chat_id="123",
+        command_handlers={"/health": builder},
+        offset_path=str(offset_path),
+    )
+    assert restarted._last_update_id == 41
+
+
+@pytest.mark.asyncio
+async def test_telegram_health_service_slow_handler_does_not_block_polling() -> None:
+    bot = HangingBot(
+        updates=[
+            {"update_id": 7, "message": {"text": "/health", "chat": {"id": "123"}}},
+            {"update_id": 8, "message": {"text": "/stats", "chat": {"id": "123"}}},
+        ]
+    )
+
+    async def health_builder() -> str:
+        await asyncio.sleep(3600)
+        return "<pre>HEALTH</pre>"
+
+    async def stats_builder() -> str:
+        return "<pre>STATS</pre>"
+
+    stop_event = asyncio.Event()
+    service = TelegramHealthService(
+        bot=bot,
+        allowed_chat_id="123",
+        command_handlers={"/health": health_builder, "/stats": stats_builder},
+    )
+    task = asyncio.create_task(service.run(stop_event))
+    await asyncio.sleep(0.05)
+
+    assert "<pre>STATS</pre>" in [item["text"] for item in bot.sent]
+    assert bot.offsets == [None, 9]
+    stop_event.set()
+    await asyncio.wait_for(task, timeout=1)
+    assert not service._handler_tasks
+
+
+@pytest.mark.asyncio
+async def test_telegram_health_service_applies_cooldown_while_run_in_flight() -> None:
+    bot = FakeBot(updates=[])
+    calls = 0
+    release = asyncio.Event()
+
+    async def builder() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "<pre>OK</pre>"
+
+    service = TelegramHealthService(
+        bot=bot,
+        allowed_chat_id="123",
+        command_handlers={"/stats": builder},
+        cooldown_seconds=20.0,
+    )
+    update = {"update_id": 1, "message": {"text": "/stats", "chat": {"id": "123"}}}
+    first = asyncio.create_task(service._handle_update(update))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(service._handle_update(update))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert calls == 1
+    texts = [item["text"] for item in bot.sent]
+    assert texts[0].startswith("<pre>/stats cooldown: wait")
+    assert texts[1] == "<pre>OK</pre>"
+
+
+def test_store_update_offset_logs_write_failure_once(tmp_path, caplog: pytest.LogCaptureFixture) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    path = str(blocker / "offset")
+
+    with caplog.at_level("WARNING"):
+        _store_update_offset(path, 1)
+        _store_update_offset(path, 2)
+
+    assert sum("cannot persist Telegram update offset" in record.message for record in caplog.records) == 1
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from array import array
+
+from project_phantom.core.ringq import RingQueue
+from project_phantom.core.types import HealthCounters
+from project_phantom.run_bot import _format_stats_report, _get_snapshot, _PipelineCounters, _SymbolRuntime
+
+
+def _runtime(symbol: str) -> _SymbolRuntime:
+    return _SymbolRuntime(
+        symbol=symbol,
+        queue_l0=RingQueue(4),
+        queue_l1=RingQueue(4),
+        queue_l2=RingQueue(4),
+        health_l0=HealthCounters(),
+        health_l1=HealthCounters(),
+        health_l2=HealthCounters(),
+        health_l3=HealthCounters(),
+    )
+
+
+def test_snapshot_caches_counters_but_reads_queue_depths_live() -> None:
+    runtimes = [_runtime("BTCUSDT"), _runtime("ETHUSDT")]
+    runtimes[0].health_l1.emitted_events = 2
+    runtimes[1].health_l1.emitted_events = 3
+    pipeline = _PipelineCounters(runtimes)
+    execution_queue: RingQueue[int] = RingQueue(4)
+    layer_depths = array("q", [0, 0, 0])
+
+    queue_sizes, counters = _get_snapshot(pipeline, execution_queue, layer_depths)  # type: ignore[arg-type]
+    assert queue_sizes == {"l0": 0, "l1": 0, "l2": 0, "l3": 0}
+    assert counters["layer1"].emitted_events == 5
+
+    layer_depths[1] = 7
+    execution_queue.put_nowait(1)
+    runtimes[0].health_l1.emitted_events = 10
+    queue_sizes, counters = _get_snapshot(pipeline, execution_queue, layer_depths)  # type: ignore[arg-type]
+    assert queue_sizes == {"l0": 0, "l1": 7, "l2": 0, "l3": 1}
+    assert counters["layer1"].emitted_events == 5
+
+    other = _PipelineCounters([_runtime("SOLUSDT")])
+    assert other.get()["layer1"].emitted_events == 0
+
+
+def test_stats_report_lists_symbols_alphabetically() -> None:
+    runtimes = [_runtime(f"S{index:02d}USDT") for index in range(25, 0, -1)]
+    report = _format_stats_report(
+        symbol_scope="TEST",
+        queue_sizes={},
+        counters=_PipelineCounters(runtimes).get(),
+        runtimes=runtimes,
+    )
+    listed = [line.split(":")[0].strip() for line in report.splitlines() if line.startswith("S") and "USDT" in line]
+    assert listed == [f"S{index:02d}USDT" for index in range(1, 21)]
+    assert "... +5 more symbols" in report
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from project_phantom.run_bot import _apply_fanout_cap
+from dataclasses import replace
+
+from project_phantom.config import Layer1Config, Layer3Config
+from project_phantom.run_bot import _apply_fanout_cap, _ranked_queue_maxsize, _symbol_config
 
 
 def test_apply_fanout_cap_trims_when_above_limit() -> None:
@@ -14,3 +17,27 @@ def test_apply_fanout_cap_allows_when_unsafe_enabled() -> None:
     symbols = [f"S{i}USDT" for i in range(30)]
     output = _apply_fanout_cap(symbols, hard_cap_symbols=25, allow_unsafe_fanout=True)
     assert output == symbols
+
+
+def test_ranked_queue_maxsize_favours_liquid_symbols_within_bounds() -> None:
+    sizes = [_ranked_queue_maxsize(rank, 40) for rank in range(50)]
+    assert sizes[0] == 320
+    assert sizes == sorted(sizes, reverse=True)
+    assert min(sizes) == 20
+    assert _ranked_queue_maxsize(0, 200) == 400
+
+
+def test_symbol_configs_do_not_share_nested_configs() -> None:
+    base = Layer3Config(execution_mode="paper")
+    base = replace(base, telegram=replace(base.telegram, enabled=False))
+    btc = _symbol_config(base, symbol="BTCUSDT")
+    eth = _symbol_config(base, symbol="ETHUSDT")
+    btc.telegram.enabled = True
+    btc.risk.tp1_r_multiple = 9.0
+
+    assert (btc.symbol, eth.symbol) == ("BTCUSDT", "ETHUSDT")
+    assert eth.telegram.enabled is False and base.telegram.enabled is False
+    assert eth.risk.tp1_r_multiple == base.risk.tp1_r_multiple != 9.0
+
+    base_l1 = Layer1Config()
+    assert _symbol_config(base_l1, symbol="ETHUSDT").thresholds is not base_l1.thresholds
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+import pytest
+
+from project_phantom import run_bot
+
+
+def _args(cache_path: str, max_symbols: int) -> argparse.Namespace:
+    return argparse.Namespace(symbol="BTCUSDT", symbols="ALL_COMMON", max_symbols=max_symbols, symbols_cache=cache_path)
+
+
+@pytest.mark.asyncio
+async def test_resolve_symbols_reuses_fresh_disk_cache(tmp_path, monkeypatch) -> None:  # noqa: ANN001
+    calls = 0
+
+    async def fake_discover(endpoints, *, max_symbols=0):  # noqa: ANN001
+        nonlocal calls
+        calls += 1
+        return ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+    monkeypatch.setattr(run_bot, "discover_common_futures_symbols", fake_discover)
+    cache_path = str(tmp_path / "common_symbols.json")
+
+    assert await run_bot._resolve_symbols(_args(cache_path, 2)) == ["BTCUSDT", "ETHUSDT"]
+    assert await run_bot._resolve_symbols(_args(cache_path, 3)) == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    assert calls == 1
+
+    stale = time.time() - run_bot.SYMBOLS_CACHE_TTL_SECONDS - 1
+    os.utime(cache_path, (stale, stale))
+    await run_bot._resolve_symbols(_args(cache_path, 2))
+    assert calls == 2
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 
 from project_phantom.config import ExchangeEndpoints
 from project_phantom.universe import (
+    close_discovery_session,
     discover_common_futures_symbols,
     parse_binance_quote_volume,
     parse_binance_usdt_perpetual_symbols,
@@ -66,5 +69,91 @@ async def test_discover_falls_back_to_bybit_when_binance_unavailable(monkeypatch
     monkeypatch.setattr("project_phantom.universe._fetch_binance_quote_volumes", _binance_volumes)
     monkeypatch.setattr("project_phantom.universe._fetch_bybit_symbols", _bybit_symbols)
 
-    symbols = await discover_common_futures_symbols(ExchangeEndpoints(), max_symbols=0)
+    try:
+        symbols = await discover_common_futures_symbols(ExchangeEndpoints(), max_symbols=0)
+    finally:
+        await close_discovery_session()
     assert symbols == ["BTCUSDT", "DOGEUSDT"]
+
+
+def _patch_binance_hosts(
+    monkeypatch: pytest.MonkeyPatch,
+    answers: dict[str, tuple[float, set[str]]],
+    *,
+    hedge_delay: float,
+) -> tuple[list[str], list[str]]:
+    called: list[str] = []
+    volume_bases: list[str] = []
+
+    async def _binance_symbols(session, rest_base):  # noqa: ANN001
+        called.append(rest_base)
+        delay, symbols = answers.get(rest_base, (10.0, {"XRPUSDT"}))
+        await asyncio.sleep(delay)
+        return set(symbols)
+
+    async def _binance_volumes(session, rest_base):  # noqa: ANN001
+        volume_bases.append(rest_base)
+        return {"ETHUSDT": 2.0, "BTCUSDT": 1.0}
+
+    async def _bybit_symbols(*args, **kwargs):  # noqa: ANN001
+        return {"BTCUSDT", "ETHUSDT", "DOGEUSDT"}
+
+    monkeypatch.setattr("project_phantom.universe._BINANCE_HEDGE_DELAY_SECONDS", hedge_delay)
+    monkeypatch.setattr("project_phantom.universe._fetch_binance_symbols", _binance_symbols)
+    monkeypatch.setattr("project_phantom.universe._fetch_binance_quote_volumes", _binance_volumes)
+    monkeypatch.setattr("project_phantom.universe._fetch_bybit_symbols", _bybit_symbols)
+    return called, volume_bases
+
+
+@pytest.mark.asyncio
+async def test_discover_hedges_to_fallback_hosts_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    primary = ExchangeEndpoints().binance_rest
+    called, volume_bases = _patch_binance_hosts(
+        monkeypatch,
+        {"https://fapi2.binance.com": (0.0, {"BTCUSDT", "ETHUSDT"})},
+        hedge_delay=0.02,
+    )
+
+    try:
+        symbols = await asyncio.wait_for(discover_common_futures_symbols(ExchangeEndpoints()), timeout=1)
+    finally:
+        await close_discovery_session()
+    assert symbols == ["ETHUSDT", "BTCUSDT"]
+    assert called == [primary, "https://fapi1.binance.com", "https://fapi2.binance.com"]
+    assert volume_bases == ["https://fapi2.binance.com"]
+
+
+@pytest.mark.asyncio
+async def test_discover_only_asks_primary_when_it_answers_in_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    primary = ExchangeEndpoints().binance_rest
+    called, volume_bases = _patch_binance_hosts(
+        monkeypatch,
+        {primary: (0.01, {"BTCUSDT", "ETHUSDT"}), "https://fapi1.binance.com": (0.0, {"XRPUSDT"})},
+        hedge_delay=0.5,
+    )
+
+    try:
+        symbols = await asyncio.wait_for(discover_common_futures_symbols(ExchangeEndpoints()), timeout=1)
+    finally:
+        await close_discovery_session()
+    assert symbols == ["ETHUSDT", "BTCUSDT"]
+    assert called == [primary]
+    assert volume_bases == [primary]
+
+
+@pytest.mark.asyncio
+async def test_discover_moves_to_next_host_as_soon_as_one_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    primary = ExchangeEndpoints().binance_rest
+    called, volume_bases = _patch_binance_hosts(
+        monkeypatch,
+        {primary: (0.0, set()), "https://fapi1.binance.com": (0.0, {"BTCUSDT", "ETHUSDT"})},
+        hedge_delay=10.0,
+    )
+
+    try:
+        symbols = await asyncio.wait_for(discover_common_futures_symbols(ExchangeEndpoints()), timeout=1)
+    finally:
+        await close_discovery_session()
+    assert symbols == ["ETHUSDT", "BTCUSDT"]
+    assert called == [primary, "https://fapi1.binance.com"]
+    assert volume_bases == ["https://fapi1.binance.com"]
@@ -1,7 +1,16 @@
-import requests
+import aiohttp
+import asyncio
 import json
 import time
 import csv
+import sys
+from pathlib import Path
+
+# project_phantom lives in Codex-P1/ beside these scripts; reuse its orjson-or-json loader.
+sys.path.insert(0, str(Path(__file__).resolve().parent / "Codex-P1"))
+from project_phantom.core.jsonio import json_loads  # noqa: E402
+
+MUDREX_PAGE_WINDOW = 4  # Offset pages requested concurrently per round
 
 
 def load_secrets():
@@ -12,7 +21,7 @@ def load_secrets():
         print("secrets.json not found. Please create it with your Mudrex API credentials.")
         return {}
 
-def fetch_mudrex_perpetuals(secrets):
+async def fetch_mudrex_perpetuals(session, secrets):
     print("Fetching Mudrex Futures...")
     api_key = secrets.get("mudrex_api_key")
     # Base URL from secrets or default to what we found
@@ -20,80 +29,89 @@ def fetch_mudrex_perpetuals(secrets):
     
     if not api_key or api_key == "YOUR_API_KEY_HERE":
         print("Skipping Mudrex: API key not configured in secrets.json")
-        return []
+        return set()
 
     # Validated endpoint: /futures with pagination
     url = f"{base_url.rstrip('/')}/futures"
     
     api_secret = secrets.get("mudrex_api_secret")
-    headers = {
-        "X-Authentication": api_secret, 
-        "Content-Type": "application/json"
-    }
+    headers = {"Content-Type": "application/json"}
+    if api_secret:
+        headers["X-Authentication"] = api_secret
 
-    active_pairs = []
+    active_pairs = set()
     offset = 0
     limit = 100 # Using a reasonable limit
 
-    try:
-        while True:
-            params = {"offset": offset, "limit": limit}
-            response = requests.get(url, headers=headers, params=params)
+    async def fetch_page(page_offset):
+        params = {"offset": page_offset, "limit": limit}
+        async with session.get(url, headers=headers, params=params) as response:
             response.raise_for_status()
-            data = response.json()
-            
-            # Handle potential response structures
-            results = data if isinstance(data, list) else data.get('data', [])
-            
-            if not results:
-                break
-                
-            current_batch_count = 0
-            for item in results:
-                symbol = item.get('symbol') or item.get('name')
-                if symbol:
-                    active_pairs.append(symbol)
-                    current_batch_count += 1
-            
-            if current_batch_count < limit:
-                break
-                
-            offset += limit
-            time.sleep(0.1) # Rate limit politeness
+            return await response.json(content_type=None, loads=json_loads)
+
+    try:
+        # Offsets don't depend on the previous response, so request a window of pages at once.
+        done = False
+        while not done:
+            # Pages past the end are speculative; their errors only matter if no short page came first.
+            pages = await asyncio.gather(
+                *(fetch_page(offset + i * limit) for i in range(MUDREX_PAGE_WINDOW)),
+                return_exceptions=True,
+            )
+            for data in pages:
+                if isinstance(data, BaseException):
+                    raise data
+                # Handle potential response structures
+                results = data if isinstance(data, list) else data.get('data', [])
+
+                current_batch_count = 0
+                for item in results:
+                    symbol = item.get('symbol') or item.get('name')
+                    if symbol:
+                        active_pairs.add(symbol)
+                        current_batch_count += 1
+
+                if current_batch_count < limit:
+                    done = True
+                    break
+
+            offset += MUDREX_PAGE_WINDOW * limit
+            if not done:
+                await asyncio.sleep(0.1) # Rate limit politeness
         
-        return sorted(active_pairs)
+        return active_pairs
 
     except Exception as e:
         print(f"Error fetching Mudrex data: {e}")
-        return []
+        return set()
 
 
-def fetch_binance_perpetuals():
+async def fetch_binance_perpetuals(session):
     print("Fetching Binance USDT Futures...")
     try:
         url = "https://fapi.binance.com/fapi/v1/exchangeInfo"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        async with session.get(url) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None, loads=json_loads)
         
-        active_pairs = []
+        active_pairs = set()
         for symbol in data['symbols']:
             if symbol['status'] == 'TRADING' and symbol['contractType'] == 'PERPETUAL':
-                active_pairs.append(symbol['symbol'])
+                active_pairs.add(symbol['symbol'])
         
-        return sorted(active_pairs)
+        return active_pairs
     except Exception as e:
         print(f"Error fetching Binance data: {e}")
-        return []
+        return set()
 
-def fetch_bybit_perpetuals():
+async def fetch_bybit_perpetuals(session):
     print("Fetching Bybit Linear Contracts...")
     try:
         # category=linear covers USDT and USDC perpetuals
         # limit=1000 to ensure we get all (default is often small)
         url = "https://api.bybit.com/v5/market/instruments-info?category=linear&limit=1000"
         
-        active_pairs = []
+        active_pairs = set()
         cursor = ""
         
         while True:
@@ -103,57 +121,65 @@ def fetch_bybit_perpetuals():
             else:
                request_url = url
                
-            response = requests.get(request_url)
-            response.raise_for_status()
-            data = response.json()
+            async with session.get(request_url) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None, loads=json_loads)
             
             if data['retCode'] != 0:
                 print(f"Bybit API Error: {data['retMsg']}")
                 break
                 
-            for item in data['result']['list']:
-                # Filter specifically for LinearPerpetual to avoid futures with expiration dates
-                # Also double check symbol ends with USDT as requested
-                is_usdt_perp = (
-                    item['status'] == 'Trading' and 
-                    item.get('contractType') == 'LinearPerpetual' and 
-                    item['symbol'].endswith('USDT')
-                )
-                if is_usdt_perp:
-                    active_pairs.append(item['symbol'])
+            # Filter specifically for LinearPerpetual to avoid futures with expiration dates
+            # Also double check symbol ends with USDT as requested
+            active_pairs.update(
+                item['symbol']
+                for item in data['result']['list']
+                if item['status'] == 'Trading'
+                and item.get('contractType') == 'LinearPerpetual'
+                and item['symbol'].endswith('USDT')
+            )
             
             cursor = data['result'].get('nextPageCursor')
             if not cursor:
                 break
             
             # Rate limit politeness
-            time.sleep(0.1)
+            await asyncio.sleep(0.1)
             
-        return sorted(active_pairs)
+        return active_pairs
     except Exception as e:
         print(f"Error fetching Bybit data: {e}")
-        return []
+        return set()
+
+async def fetch_all(secrets):
+    # The three exchanges are independent, so query them concurrently over one session.
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            fetch_binance_perpetuals(session),
+            fetch_bybit_perpetuals(session),
+            fetch_mudrex_perpetuals(session, secrets),
+        )
 
 def main():
     secrets = load_secrets()
     
-    binance_pairs = fetch_binance_perpetuals()
-    bybit_pairs = fetch_bybit_perpetuals()
-    mudrex_pairs = fetch_mudrex_perpetuals(secrets)
+    binance_set, bybit_set, mudrex_set = asyncio.run(fetch_all(secrets))
     
     print(f"\n--- Summary ---")
-    print(f"Binance USDT-M Active Pairs: {len(binance_pairs)}")
-    print(f"Bybit Linear Active Pairs: {len(bybit_pairs)}")
-    
-    mudrex_set = set(mudrex_pairs)
-    bybit_set = set(bybit_pairs)
-    binance_set = set(binance_pairs)
+    print(f"Binance USDT-M Active Pairs: {len(binance_set)}")
+    print(f"Bybit Linear Active Pairs: {len(bybit_set)}")
     
     # Pairs in Bybit but NOT in Mudrex
-    missing_bybit_in_mudrex = sorted(list(bybit_set - mudrex_set))
+    missing_bybit_in_mudrex = sorted(bybit_set - mudrex_set)
     
     # Pairs in Binance but NOT in Mudrex
-    missing_binance_in_mudrex = sorted(list(binance_set - mudrex_set))
+    missing_binance_in_mudrex = sorted(binance_set - mudrex_set)
+
+    # The fetchers hand back sets; sort each once here for the files and previews below.
+    binance_pairs = sorted(binance_set)
+    bybit_pairs = sorted(bybit_set)
+    mudrex_pairs = sorted(mudrex_set)
     
     if mudrex_pairs:
         print(f"Mudrex Active Pairs: {len(mudrex_pairs)}")
@@ -181,12 +207,9 @@ def main():
     with open(csv_file, "w", newline='') as f:
         writer = csv.writer(f)
         writer.writerow(["Exchange", "Symbol"])
-        for pair in binance_pairs:
-            writer.writerow(["Binance", pair])
-        for pair in bybit_pairs:
-            writer.writerow(["Bybit", pair])
-        for pair in mudrex_pairs:
-            writer.writerow(["Mudrex", pair])    
+        writer.writerows(("Binance", pair) for pair in binance_pairs)
+        writer.writerows(("Bybit", pair) for pair in bybit_pairs)
+        writer.writerows(("Mudrex", pair) for pair in mudrex_pairs)
             
     print(f"Saved CSV to {csv_file}")
 
@@ -195,8 +218,7 @@ def main():
     with open(bybit_csv_file, "w", newline='') as f:
         writer = csv.writer(f)
         writer.writerow(["Symbol"])
-        for pair in bybit_pairs:
-            writer.writerow([pair])
+        writer.writerows((pair,) for pair in bybit_pairs)
             
     print(f"Saved Bybit-only CSV to {bybit_csv_file}")
     
@@ -206,8 +228,7 @@ def main():
         with open(missing_bybit_csv, "w", newline='') as f:
             writer = csv.writer(f)
             writer.writerow(["Symbol (On Bybit but not Mudrex)"])
-            for pair in missing_bybit_in_mudrex:
-                writer.writerow([pair])
+            writer.writerows((pair,) for pair in missing_bybit_in_mudrex)
         print(f"Saved Missing Bybit Pairs CSV to {missing_bybit_csv}")
 
         # Save Missing Pairs CSV (Binance - Mudrex)
@@ -215,8 +236,7 @@ def main():
         with open(missing_binance_csv, "w", newline='') as f:
             writer = csv.writer(f)
             writer.writerow(["Symbol (On Binance but not Mudrex)"])
-            for pair in missing_binance_in_mudrex:
-                writer.writerow([pair])
+            writer.writerows((pair,) for pair in missing_binance_in_mudrex)
         print(f"Saved Missing Binance Pairs CSV to {missing_binance_csv}")
     
     # Also print a preview
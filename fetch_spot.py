@@ -1,27 +1,39 @@
-import requests
+import aiohttp
+import asyncio
 import json
-import time
 import csv
+import heapq
+import sys
+from pathlib import Path
 
-def fetch_binance_spot():
+# project_phantom lives in Codex-P1/ beside these scripts; reuse its orjson-or-json loader.
+sys.path.insert(0, str(Path(__file__).resolve().parent / "Codex-P1"))
+from project_phantom.core.jsonio import json_loads  # noqa: E402
+
+MUDREX_PAGE_WINDOW = 4  # Offset pages requested concurrently per round
+
+async def fetch_binance_spot(session):
     print("Fetching Binance Spot Pairs...")
     try:
         url = "https://api.binance.com/api/v3/exchangeInfo"
-        response = requests.get(url)
-        response.raise_for_status()
-        data = response.json()
+        # Let Binance drop non-trading symbols and the per-symbol permission sets,
+        # which make up most of the multi-MB payload; the status check below stays as a guard.
+        params = {"symbolStatus": "TRADING", "showPermissionSets": "false"}
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            data = await response.json(content_type=None, loads=json_loads)
         
         active_assets = set()
         for symbol in data['symbols']:
             if symbol['status'] == 'TRADING' and symbol['quoteAsset'] == 'USDT':
                 active_assets.add(symbol['baseAsset'])
         
-        return sorted(list(active_assets))
+        return active_assets
     except Exception as e:
         print(f"Error fetching Binance data: {e}")
-        return []
+        return set()
 
-def fetch_bybit_spot():
+async def fetch_bybit_spot(session):
     print("Fetching Bybit Spot Pairs...")
     try:
         url = "https://api.bybit.com/v5/market/instruments-info?category=spot&limit=1000"
@@ -31,118 +43,113 @@ def fetch_bybit_spot():
         
         while True:
             request_url = f"{url}&cursor={cursor}" if cursor else url
-            response = requests.get(request_url)
-            response.raise_for_status()
-            data = response.json()
+            async with session.get(request_url) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None, loads=json_loads)
             
             if data['retCode'] != 0:
                 print(f"Bybit API Error: {data['retMsg']}")
                 break
                 
-            for item in data['result']['list']:
-                if item['status'] == 'Trading' and item['quoteCoin'] == 'USDT':
-                    active_assets.add(item['baseCoin'])
+            active_assets.update(
+                item['baseCoin']
+                for item in data['result']['list']
+                if item['status'] == 'Trading' and item['quoteCoin'] == 'USDT'
+            )
             
             cursor = data['result'].get('nextPageCursor')
             if not cursor:
                 break
             
-            time.sleep(0.1)
+            await asyncio.sleep(0.1)
             
-        return sorted(list(active_assets))
+        return active_assets
     except Exception as e:
         print(f"Error fetching Bybit data: {e}")
-        return []
+        return set()
 
-def fetch_mudrex_coins():
+async def fetch_mudrex_coins(session):
     print("Fetching Mudrex Spot Coins (from /api/v1/coins)...")
     try:
         url = "https://mudrex.com/api/v1/coins"
         coins = set()
         offset = 0
         limit = 500 # Validated that 500 works or we can use smaller if needed.
-        
-        while True:
-            params = {"limit": limit, "offset": offset}
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Response is a list of objects based on curl output: [{"id":..., "symbol": "AFC", ...}, ...]
-            # Or wrapped in data? The curl output showed:
-            # `[{"id":"...","symbol":"AFC"...` (It seemed to start with a list bracket or was it truncated?)
-            # Wait, curl output step 463 started with `e_strength_index"`. 
-            # Let's verify structure safely.
-            
-            items = []
+
+        async def fetch_items(page_offset):
+            params = {"limit": limit, "offset": page_offset}
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None, loads=json_loads)
+            # Response is normally a bare list of coin objects; tolerate a {"data": [...]} wrapper too.
             if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict):
-                # Maybe {"success": true, "data": [...]} ?
-                items = data.get('data', [])
-            
-            if not items:
-                print("DEBUG: No items found in response.")
-                break
-                
-            for item in items:
-                symbol = item.get('symbol')
-                if symbol:
-                    coins.add(symbol.upper())
-            
-            count = len(items)
-            print(f"DEBUG: Fetched {count} items in this batch. Total unique coins: {len(coins)}")
-            
-            if count == 0:
-                print("DEBUG: Reached end of list (0 items returned).")
+                return data
+            if isinstance(data, dict):
+                return data.get('data', [])
+            return []
+
+        # Probe the first page: the server may cap the page below `limit` (25 has been seen),
+        # and the returned count is both the stride for later pages and the end-of-list test.
+        items = await fetch_items(offset)
+        page_size = len(items)
+        pages = [items]
+
+        while True:
+            done = False
+            for items in pages:
+                if isinstance(items, BaseException):
+                    raise items
+                coins.update(map(str.upper, filter(None, (item.get('symbol') for item in items))))
+
+                count = len(items)
+                print(f"DEBUG: Fetched {count} items in this batch. Total unique coins: {len(coins)}")
+                offset += count
+
+                # Whether the server forces 25 or honours limit=500, a page shorter
+                # than the probed one is the last.
+                if not items or count < page_size:
+                    print(f"DEBUG: Reached end of list (batch size {count} < {page_size}).")
+                    done = True
+                    break
+
+            if done:
                 break
-                
-            # If we requested limit but got fewer items, it *might* be the end, 
-            # OR the server enforces a lower max limit.
-            # To be safe, we continue unless it's 0, but we must update offset by actual count.
-            offset += count
-            
-            # Safety break if we got significantly fewer than expected default page (e.g. 1 or 2 items might be end?)
-            # But 25 looks like a page size. if we get 25, we continue.
-            # If we get < 25 AND we suspect 25 is the max page size, it's the end.
-            # But let's just rely on 0 items to stop, or if count < 25 (assuming 25 is the forced limit).
-            if count < 25: 
-                 # If server forces 25, getting less means end. 
-                 # If server respects limit=500, getting less means end.
-                 print(f"DEBUG: Reached end of list (batch size {count} < 25).")
-                 break
-                 
-            time.sleep(0.1)
-        
-        return sorted(list(coins))
 
-    except Exception as e:
-        print(f"Error fetching Mudrex data: {e}")
-        return []
+            await asyncio.sleep(0.1)
+            # Pages past the end are speculative; the loop above stops at the first short page,
+            # so a failure is only raised when it comes before that.
+            pages = await asyncio.gather(
+                *(fetch_items(offset + i * page_size) for i in range(MUDREX_PAGE_WINDOW)),
+                return_exceptions=True,
+            )
         
-        return sorted(list(set(coins)))
+        return coins
 
     except Exception as e:
         print(f"Error fetching Mudrex data: {e}")
-        return []
+        return set()
+
+async def fetch_all():
+    # The three exchanges are independent, so query them concurrently over one session.
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        return await asyncio.gather(
+            fetch_binance_spot(session),
+            fetch_bybit_spot(session),
+            fetch_mudrex_coins(session),
+        )
 
 def main():
-    binance_assets = fetch_binance_spot()
-    bybit_assets = fetch_bybit_spot()
-    mudrex_coins = fetch_mudrex_coins()
+    binance_assets, bybit_assets, mudrex_coins = asyncio.run(fetch_all())
     
     print(f"\n--- Summary (Spot Market) ---")
     print(f"Binance USDT Spot Assets: {len(binance_assets)}")
     print(f"Bybit USDT Spot Assets: {len(bybit_assets)}")
     print(f"Mudrex Supported Coins: {len(mudrex_coins)}")
     
-    mudrex_set = set(mudrex_coins)
-    bybit_set = set(bybit_assets)
-    binance_set = set(binance_assets)
-    
     # Missing on Mudrex
-    missing_bybit = sorted(list(bybit_set - mudrex_set))
-    missing_binance = sorted(list(binance_set - mudrex_set))
+    missing_bybit = sorted(bybit_assets - mudrex_coins)
+    missing_binance = sorted(binance_assets - mudrex_coins)
     
     print(f"Assets on Bybit Spot but MISSING on Mudrex: {len(missing_bybit)}")
     print(f"Assets on Binance Spot but MISSING on Mudrex: {len(missing_binance)}")
@@ -168,7 +175,7 @@ def main():
         
     # Preview
     print("\nFirst 10 Mudrex Coins:")
-    print(", ".join(mudrex_coins[:10]))
+    print(", ".join(heapq.nsmallest(10, mudrex_coins)))
     print("\nFirst 10 Missing (from Bybit):")
     print(", ".join(missing_bybit[:10]))
 